@@ -11,6 +11,7 @@ interface UseWebSocketOptions {
 }
 
 const WS_URL = import.meta.env.VITE_WS_URL || 'ws://localhost:8000'
+const textDecoder = new TextDecoder()
 
 export function useWebSocket(endpoint: string, options: UseWebSocketOptions = {}) {
   const {
@@ -35,6 +36,8 @@ export function useWebSocket(endpoint: string, options: UseWebSocketOptions = {}
     }
 
     const ws = new WebSocket(url)
+    // The server may send events as binary frames of UTF-8 JSON
+    ws.binaryType = 'arraybuffer'
 
     ws.onopen = () => {
       console.log('WebSocket connected:', endpoint)
@@ -49,9 +52,13 @@ export function useWebSocket(endpoint: string, options: UseWebSocketOptions = {}
 
     ws.onmessage = (event) => {
       try {
-        const data = JSON.parse(event.data) as RealtimeEvent
-        setLastEvent(data)
-        onMessage?.(data)
+        // Bursts of events arrive batched as a JSON array
+        const text = typeof event.data === 'string' ? event.data : textDecoder.decode(event.data)
+        const parsed = JSON.parse(text) as RealtimeEvent | RealtimeEvent[]
+        const events = Array.isArray(parsed) ? parsed : [parsed]
+        if (events.length === 0) return
+        events.forEach((data) => onMessage?.(data))
+        setLastEvent(events[events.length - 1])
       } catch (error) {
         console.error('Failed to parse WebSocket message:', error)
       }
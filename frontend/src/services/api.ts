@@ -60,15 +60,17 @@ export const analyticsAPI = {
   },
 
   predictProductivity: async (historicalData: number[], forecastDays: number = 7): Promise<Forecast[]> => {
-    const { data } = await api.post('/api/v1/analytics/predict/productivity', null, {
-      params: { historical_data: historicalData, forecast_days: forecastDays }
+    const { data } = await api.post('/api/v1/analytics/predict/productivity', {
+      historical_data: historicalData,
+      forecast_days: forecastDays
     })
     return data.forecasts
   },
 
   analyzeTrend: async (timeSeriesData: number[], dataType: string = 'productivity'): Promise<TrendAnalysis> => {
-    const { data } = await api.post('/api/v1/analytics/analyze/trend', null, {
-      params: { time_series_data: timeSeriesData, data_type: dataType }
+    const { data } = await api.post('/api/v1/analytics/analyze/trend', {
+      time_series_data: timeSeriesData,
+      data_type: dataType
     })
     return data
   },
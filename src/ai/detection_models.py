@@ -2,7 +2,7 @@
 Detection Data Models
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import List, Optional
 from datetime import datetime
 
@@ -19,6 +19,11 @@ class Detection(BaseModel):
         description="[x1, y1, x2, y2] normalized to [0, 1]"
     )
 
+    @classmethod
+    def fast_build(cls, **data) -> "Detection":
+        """Build without validation (hot path, values come from the model)"""
+        return cls.model_construct(**data)
+
     # Computed properties
     @property
     def center_x(self) -> float:
@@ -57,10 +62,40 @@ class DetectionResult(BaseModel):
     frame_width: int
     frame_height: int
 
+    _person_count: Optional[int] = PrivateAttr(default=None)
+
+    @classmethod
+    def fast_build(cls, person_count: Optional[int] = None, **data) -> "DetectionResult":
+        """Build without validation (hot path, detections already built)"""
+        result = cls.model_construct(**data)
+        result._person_count = person_count
+        return result
+
     @property
     def person_count(self) -> int:
-        """Count of person detections"""
-        return len([d for d in self.detections if d.class_name == "person"])
+        """Count of person detections (computed once)"""
+        if self._person_count is None:
+            self._person_count = sum(1 for d in self.detections if d.class_name == "person")
+        return self._person_count
+
+    def to_fast_dict(self) -> dict:
+        """
+        Compact plain-Python dict for streaming (e.g. orjson.dumps over websockets)
+
+        Skips pydantic serialization; timestamp is a POSIX float.
+        """
+        return {
+            "camera_id": self.camera_id,
+            "ts": self.timestamp.timestamp(),
+            "frame": self.frame_number,
+            "detections": [
+                {"c": d.class_id, "n": d.class_name, "p": d.confidence, "b": d.bbox}
+                for d in self.detections
+            ],
+            "ms": self.inference_time_ms,
+            "w": self.frame_width,
+            "h": self.frame_height
+        }
 
     class Config:
         from_attributes = True
@@ -76,6 +111,20 @@ class DetectionConfig(BaseModel):
     max_detections: int = Field(default=100, ge=1)
     classes: Optional[List[int]] = Field(default=[0], description="Class IDs to detect (0=person)")
     img_size: int = Field(default=640, description="Input image size")
+    export_format: Optional[str] = Field(
+        default=None,
+        description="Opt-in exported runtime: auto (engine on cuda, openvino on cpu), engine, openvino, onnx; None uses the raw .pt"
+    )
+    half_precision: bool = Field(default=True, description="FP16 inference/export on GPU")
+    int8: bool = Field(default=False, description="INT8 quantized export (requires calibration data)")
+    batch: int = Field(default=1, ge=1, description="Max batch size baked into the exported model")
+    calibration_data: Optional[str] = Field(default=None, description="Dataset YAML used for INT8 calibration")
+    gpu_preprocess: bool = Field(default=True, description="Letterbox/normalize frames on the GPU when using cuda")
+    motion_threshold: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        description="Mean abs pixel diff (0-255) on a 64x64 thumbnail below which inference is skipped (None = off)"
+    )
 
     class Config:
         from_attributes = True
@@ -5,9 +5,11 @@ Handles person detection using Ultralytics YOLOv8
 
 import cv2
 import numpy as np
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
 import logging
+import os
 import time
 
 from .detection_models import Detection, DetectionResult, DetectionConfig
@@ -28,13 +30,28 @@ class YOLODetector:
         self.config = config
         self.model = None
         self._frame_counter = 0
+        self._max_batch = None  # Exported engines have a fixed max batch size
+        self._use_half = False
+        self._ort_session = None  # ONNX Runtime session for the CPU path
+
+        # Pinned host buffers for GPU preprocessing, keyed by (camera, slot, H, W)
+        self._pinned_buffers: Dict[Tuple[int, int, int, int], object] = {}
+        self._copy_stream = None
+
+        # Motion gate: per-camera thumbnail and last result
+        self._prev_thumb: Dict[int, np.ndarray] = {}
+        self._prev_result: Dict[int, DetectionResult] = {}
+        self.skipped_frames = 0
+
+        # Per-camera reciprocal frame sizes for bbox normalization
+        self._inv_wh_cache: Dict[Tuple[int, int, int], np.ndarray] = {}
 
         # Statistics
         self.total_detections = 0
         self.total_inference_time = 0.0
 
         # COCO class names (YOLOv8 default)
-        self.class_names = [
+        self.class_names = (
             "person", "bicycle", "car", "motorcycle", "airplane", "bus", "train", "truck", "boat",
             "traffic light", "fire hydrant", "stop sign", "parking meter", "bench", "bird", "cat",
             "dog", "horse", "sheep", "cow", "elephant", "bear", "zebra", "giraffe", "backpack",
@@ -46,7 +63,9 @@ class YOLODetector:
             "remote", "keyboard", "cell phone", "microwave", "oven", "toaster", "sink",
             "refrigerator", "book", "clock", "vase", "scissors", "teddy bear", "hair drier",
             "toothbrush"
-        ]
+        )
+        self._class_names_arr = np.array(self.class_names, dtype=object)
+        self._person_class_id = self.class_names.index("person")
 
         # Don't load model at startup - use lazy loading
         logger.info(f"YOLODetector initialized (model will load on first use)")
@@ -66,12 +85,167 @@ class YOLODetector:
                     logger.warning("CUDA not available, falling back to CPU")
                     self.config.device = "cpu"
 
+            if self.config.export_format:
+                self.model = self._load_exported_model(YOLO)
+
+            # PyTorch path on GPU: FP16 (applied when the predictor is built)
+            pytorch_cuda = self._max_batch is None and self.config.device == "cuda"
+            if pytorch_cuda:
+                self._use_half = self.config.half_precision
+
+            if self._ort_session is None:
+                self._warmup()
+
+            if pytorch_cuda:
+                # NHWC layout for cuDNN tensor-core kernels. Applied to the
+                # predictor's AutoBackend after warm-up: building it fuses
+                # Conv+BN into new contiguous weights, which would drop an
+                # earlier layout change. No CUDA graph capture: the predictor
+                # feeds AutoBackend fresh input tensors (shaped by the CPU
+                # letterbox unless gpu_preprocess is on) and runs data-dependent
+                # NMS in Python, so capture would mean replacing its forward
+                # with static buffers; export_format="engine" is the opt-in
+                # path that removes per-kernel launch overhead.
+                import torch
+                self.model.predictor.model.to(memory_format=torch.channels_last)
+
             logger.info(f"YOLOv8 model loaded successfully on {self.config.device}")
 
         except Exception as e:
             logger.error(f"Failed to load YOLOv8 model: {e}")
             raise
 
+    def _load_exported_model(self, yolo_cls):
+        """
+        Load (exporting once if needed) an optimized runtime for the model
+
+        TensorRT engines are used on CUDA and OpenVINO IR on CPU; the exported
+        artifact is cached next to the .pt file. Falls back to the PyTorch
+        model if the export toolchain is unavailable.
+
+        Args:
+            yolo_cls: Ultralytics YOLO class
+
+        Returns:
+            YOLO model wrapping the exported artifact (or the original model)
+        """
+        export_format = self.config.export_format
+        if export_format == "auto":
+            export_format = "engine" if self.config.device == "cuda" else "openvino"
+
+        model_path = Path(self.config.model_name)
+        if export_format == "openvino":
+            exported_path = model_path.parent / f"{model_path.stem}_openvino_model"
+        else:
+            exported_path = model_path.with_suffix(f".{export_format}")
+
+        try:
+            if not exported_path.exists():
+                logger.info(f"Exporting {model_path.name} to {export_format} (one-time)...")
+                export_kwargs = dict(
+                    format=export_format,
+                    imgsz=self.config.img_size,
+                    half=self.config.half_precision and self.config.device == "cuda",
+                    int8=self.config.int8,
+                    batch=self.config.batch,
+                    dynamic=self.config.batch > 1 and export_format == "engine",
+                    device=0 if self.config.device == "cuda" else "cpu"
+                )
+                if export_format == "onnx":
+                    export_kwargs["simplify"] = True
+                if self.config.int8:
+                    if self.config.calibration_data is None:
+                        logger.warning("INT8 export without calibration_data, using Ultralytics default dataset")
+                    else:
+                        export_kwargs["data"] = self.config.calibration_data
+
+                exported_path = Path(self.model.export(**export_kwargs))
+
+            model = yolo_cls(str(exported_path), task="detect")
+            self._max_batch = self.config.batch
+            if export_format == "onnx" and self.config.device == "cpu":
+                self._ort_session = self._create_ort_session(exported_path)
+            logger.info(f"Using exported {export_format} model: {exported_path}")
+            return model
+
+        except Exception as e:
+            logger.warning(f"Model export to {export_format} failed, using PyTorch model: {e}")
+            return self.model
+
+    def _create_ort_session(self, onnx_path: Path):
+        """Create a tuned ONNX Runtime session (OpenVINO EP when available)"""
+        import onnxruntime as ort
+
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+
+        available = ort.get_available_providers()
+        providers = [p for p in ("OpenVINOExecutionProvider", "CPUExecutionProvider") if p in available]
+
+        session = ort.InferenceSession(str(onnx_path), sess_options=sess_options, providers=providers)
+        logger.info(f"ONNX Runtime session created with providers: {session.get_providers()}")
+        return session
+
+    def _infer_ort(self, frame: np.ndarray):
+        """
+        Run the ONNX Runtime session on a frame
+
+        Does letterbox preprocessing and confidence/class filtering + NMS on
+        the raw (1, 4 + num_classes, N) YOLOv8 output.
+
+        Returns:
+            Tuple of (xyxy, confidences, class_ids) in frame pixels, or None
+        """
+        frame_height, frame_width = frame.shape[:2]
+        size = self.config.img_size
+
+        # Letterbox
+        gain = min(size / frame_height, size / frame_width)
+        new_h, new_w = round(frame_height * gain), round(frame_width * gain)
+        pad_h, pad_w = size - new_h, size - new_w
+        pad_top, pad_left = pad_h // 2, pad_w // 2
+        img = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        img = cv2.copyMakeBorder(img, pad_top, pad_h - pad_top, pad_left, pad_w - pad_left,
+                                 cv2.BORDER_CONSTANT, value=(114, 114, 114))
+        blob = np.ascontiguousarray(img[:, :, ::-1].transpose(2, 0, 1)[None], dtype=np.float32)
+        blob *= 1 / 255.0
+
+        input_name = self._ort_session.get_inputs()[0].name
+        output = self._ort_session.run(None, {input_name: blob})[0][0].T  # (N, 4 + num_classes)
+
+        scores = output[:, 4:]
+        class_ids = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(scores)), class_ids]
+
+        keep = confidences >= self.config.confidence_threshold
+        if self.config.classes is not None:
+            keep &= np.isin(class_ids, self.config.classes)
+        if not keep.any():
+            return None
+
+        cxcywh = output[keep, :4]
+        confidences = confidences[keep]
+        class_ids = class_ids[keep]
+
+        xyxy = np.empty_like(cxcywh)
+        xyxy[:, :2] = cxcywh[:, :2] - cxcywh[:, 2:] / 2
+        xyxy[:, 2:] = cxcywh[:, :2] + cxcywh[:, 2:] / 2
+
+        # Class-aware NMS: offset boxes per class so classes never suppress each other
+        offsets = (class_ids * (size + 1))[:, None].astype(np.float32)
+        nms_boxes = xyxy + offsets
+        indices = cv2.dnn.NMSBoxes(
+            np.concatenate([nms_boxes[:, :2], nms_boxes[:, 2:] - nms_boxes[:, :2]], axis=1).tolist(),
+            confidences.tolist(),
+            self.config.confidence_threshold,
+            self.config.iou_threshold
+        )
+        indices = np.asarray(indices, dtype=int).reshape(-1)[:self.config.max_detections]
+
+        xyxy = self._unletterbox(xyxy[indices], (gain, pad_left, pad_top), frame_width, frame_height)
+        return xyxy, confidences[indices], class_ids[indices]
+
     def detect(self, frame: np.ndarray, camera_id: int, timestamp: Optional[datetime] = None) -> DetectionResult:
         """
         Run detection on a frame
@@ -95,91 +269,344 @@ class YOLODetector:
         self._frame_counter += 1
         frame_height, frame_width = frame.shape[:2]
 
+        # Skip inference on static scenes
+        if self.config.motion_threshold is not None:
+            cached = self._check_motion_gate(frame, camera_id)
+            if cached is not None:
+                self.skipped_frames += 1
+                return cached.model_copy(update={
+                    "timestamp": timestamp,
+                    "frame_number": self._frame_counter,
+                    "inference_time_ms": 0.0
+                })
+
         # Run inference
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        if self._ort_session is not None:
+            boxes = self._infer_ort(frame)
+        else:
+            letterbox = None
+            if self.config.device == "cuda" and self.config.gpu_preprocess:
+                source, letterbox = self._preprocess_gpu(frame, camera_id)
+            else:
+                source = frame
+            results = self._run_model(source)
+            boxes = self._extract_boxes(
+                results[0] if len(results) > 0 else None,
+                frame_width, frame_height, letterbox
+            )
+        inference_time_ms = (time.perf_counter_ns() - start_ns) * 1e-6
+        self.total_inference_time += inference_time_ms
+
+        result = self._build_result(
+            boxes, camera_id, timestamp, self._frame_counter,
+            inference_time_ms, frame_width, frame_height
+        )
+
+        if self.config.motion_threshold is not None:
+            self._prev_result[camera_id] = result
+
+        return result
+
+    def _check_motion_gate(self, frame: np.ndarray, camera_id: int) -> Optional[DetectionResult]:
+        """
+        Compare a 64x64 grayscale thumbnail against the previous frame
+
+        Returns:
+            Last DetectionResult for the camera if the scene is static, else None
+        """
+        thumb = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), (64, 64),
+                           interpolation=cv2.INTER_AREA).astype(np.int16)
+        prev_thumb = self._prev_thumb.get(camera_id)
+        prev_result = self._prev_result.get(camera_id)
+
+        if (prev_thumb is not None and prev_result is not None
+                and np.abs(thumb - prev_thumb).mean() < self.config.motion_threshold):
+            return prev_result
+
+        # Scene changed: it becomes the new reference
+        self._prev_thumb[camera_id] = thumb
+        return None
+
+    def _preprocess_gpu(self, frame: np.ndarray, camera_id: int):
+        """
+        Letterbox and normalize a BGR frame on the GPU
+
+        Uploads through a pinned host buffer, then does BGR->RGB, HWC->CHW,
+        scaling to [0, 1], resize and padding on device so Ultralytics skips
+        its CPU preprocessing.
+
+        Args:
+            frame: OpenCV image (BGR format)
+            camera_id: Camera ID (pinned buffers are per camera thread)
+
+        Returns:
+            Tuple of (1x3xSxS CUDA tensor, (gain, pad_left, pad_top))
+        """
+        host_buffer = self._get_pinned_buffer(frame, (camera_id, 0))
+        img = host_buffer.to("cuda", non_blocking=True)
+        return self._letterbox_gpu(img)
+
+    def _preprocess_gpu_batch(self, frames: List[np.ndarray], camera_id: int):
+        """
+        Upload and preprocess a list of frames, overlapping H2D copies with compute
+
+        All uploads are queued on a dedicated copy stream; the compute stream
+        waits on a per-frame event, so frame k is letterboxed while frame k+1
+        is still crossing PCIe.
+
+        Returns:
+            Tuple of (Nx3xSxS CUDA tensor, list of (gain, pad_left, pad_top))
+        """
+        import torch
+
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream()
+        compute_stream = torch.cuda.current_stream()
+
+        uploads = []
+        for slot, frame in enumerate(frames):
+            host_buffer = self._get_pinned_buffer(frame, (camera_id, slot))
+            with torch.cuda.stream(self._copy_stream):
+                img = host_buffer.to("cuda", non_blocking=True)
+                uploaded = torch.cuda.Event()
+                uploaded.record(self._copy_stream)
+            uploads.append((img, uploaded))
+
+        size = self.config.img_size
+        batch = torch.empty((len(frames), 3, size, size), device="cuda", dtype=torch.float32)
+        letterboxes = []
+        for i, (img, uploaded) in enumerate(uploads):
+            compute_stream.wait_event(uploaded)
+            img.record_stream(compute_stream)
+            batch[i:i + 1], letterbox = self._letterbox_gpu(img)
+            letterboxes.append(letterbox)
+
+        return batch, letterboxes
+
+    def _get_pinned_buffer(self, frame: np.ndarray, slot_key: Tuple[int, int]):
+        """Copy a frame into a reusable pinned host buffer"""
+        import torch
+
+        frame_height, frame_width = frame.shape[:2]
+        key = (*slot_key, frame_height, frame_width)
+        host_buffer = self._pinned_buffers.get(key)
+        if host_buffer is None:
+            host_buffer = torch.empty((frame_height, frame_width, 3), dtype=torch.uint8, pin_memory=True)
+            self._pinned_buffers[key] = host_buffer
+
+        host_buffer.numpy()[...] = frame
+        return host_buffer
+
+    def _letterbox_gpu(self, img):
+        """Letterbox an HxWx3 uint8 BGR CUDA tensor into a 1x3xSxS float tensor"""
+        import torch.nn.functional as F
+
+        frame_height, frame_width = img.shape[:2]
+        img = img.flip(-1).permute(2, 0, 1).unsqueeze(0).float().div_(255.0)
+
+        size = self.config.img_size
+        gain = min(size / frame_height, size / frame_width)
+        new_h, new_w = round(frame_height * gain), round(frame_width * gain)
+        if (new_h, new_w) != (frame_height, frame_width):
+            img = F.interpolate(img, size=(new_h, new_w), mode="bilinear", align_corners=False)
+
+        pad_h, pad_w = size - new_h, size - new_w
+        pad_top, pad_left = pad_h // 2, pad_w // 2
+        img = F.pad(img, (pad_left, pad_w - pad_left, pad_top, pad_h - pad_top), value=114 / 255.0)
 
-        results = self.model(
-            frame,
+        return img, (gain, pad_left, pad_top)
+
+    def detect_batch(self, frames: List[np.ndarray], camera_id: int,
+                     timestamp: Optional[datetime] = None) -> List[DetectionResult]:
+        """
+        Run detection on multiple frames (batch processing)
+
+        All frames are passed to the model in a single call so the GPU sees
+        one batch tensor instead of N separate launches.
+
+        Args:
+            frames: List of OpenCV images
+            camera_id: Camera ID
+            timestamp: Frame timestamp (defaults to now)
+
+        Returns:
+            List of DetectionResult objects
+        """
+        if not frames:
+            return []
+
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        if self.model is None:
+            logger.info("Model not loaded yet, loading now...")
+            self._load_model()
+
+        chunk_size = self._max_batch or len(frames)
+
+        start_ns = time.perf_counter_ns()
+        if self._ort_session is not None:
+            all_boxes = [self._infer_ort(frame) for frame in frames]
+        else:
+            letterboxes = [None] * len(frames)
+            if self.config.device == "cuda" and self.config.gpu_preprocess:
+                source, letterboxes = self._preprocess_gpu_batch(frames, camera_id)
+            else:
+                source = frames
+            results = []
+            for i in range(0, len(frames), chunk_size):
+                results.extend(self._run_model(source[i:i + chunk_size]))
+            all_boxes = [
+                self._extract_boxes(result, frame.shape[1], frame.shape[0], letterbox)
+                for frame, result, letterbox in zip(frames, results, letterboxes)
+            ]
+        batch_time_ms = (time.perf_counter_ns() - start_ns) * 1e-6
+        self.total_inference_time += batch_time_ms
+
+        # Amortize batch time across frames
+        inference_time_ms = batch_time_ms / len(frames)
+
+        detection_results = []
+        for frame, boxes in zip(frames, all_boxes):
+            self._frame_counter += 1
+            frame_height, frame_width = frame.shape[:2]
+            detection_results.append(self._build_result(
+                boxes, camera_id, timestamp, self._frame_counter,
+                inference_time_ms, frame_width, frame_height
+            ))
+
+        return detection_results
+
+    def _predict_args(self) -> dict:
+        """Ultralytics predict arguments"""
+        return dict(
             conf=self.config.confidence_threshold,
             iou=self.config.iou_threshold,
             classes=self.config.classes,
             max_det=self.config.max_detections,
             device=self.config.device,
+            half=self._use_half,
             verbose=False
         )
 
-        inference_time_ms = (time.time() - start_time) * 1000
-        self.total_inference_time += inference_time_ms
+    def _warmup(self):
+        """Run one dummy frame so the predictor is built with our arguments"""
+        size = self.config.img_size
+        self.model(np.zeros((size, size, 3), dtype=np.uint8), **self._predict_args())
+
+    def _run_model(self, source):
+        """Run the model on a frame or list of frames"""
+        # Call the configured predictor directly to skip per-call argument parsing
+        predictor = self.model.predictor
+        if predictor is None:
+            return self.model(source, **self._predict_args())
+        return predictor(source)
+
+    def _extract_boxes(self, result, frame_width: int, frame_height: int,
+                       letterbox: Optional[Tuple[float, int, int]] = None):
+        """
+        Pull boxes out of an Ultralytics result as NumPy arrays
 
-        # Parse results
+        Returns:
+            Tuple of (xyxy, confidences, class_ids) in frame pixels, or None
+        """
+        if result is None or result.boxes is None or len(result.boxes) == 0:
+            return None
+
+        # Pull all boxes to host in one transfer per field
+        xyxy = result.boxes.xyxy.cpu().numpy()
+        confidences = result.boxes.conf.cpu().numpy()
+        class_ids = result.boxes.cls.cpu().numpy().astype(int)
+
+        # Boxes from GPU-preprocessed input are in letterboxed coordinates
+        if letterbox is not None:
+            xyxy = self._unletterbox(xyxy, letterbox, frame_width, frame_height)
+
+        return xyxy, confidences, class_ids
+
+    @staticmethod
+    def _unletterbox(xyxy: np.ndarray, letterbox: Tuple[float, int, int],
+                     frame_width: int, frame_height: int) -> np.ndarray:
+        """Map boxes from letterboxed model input back to frame pixels"""
+        gain, pad_left, pad_top = letterbox
+        xyxy = (xyxy - np.array([pad_left, pad_top, pad_left, pad_top], dtype=np.float32)) / gain
+        np.clip(xyxy, 0, [frame_width, frame_height, frame_width, frame_height], out=xyxy)
+        return xyxy
+
+    def _build_result(self, boxes, camera_id: int, timestamp: datetime, frame_number: int,
+                      inference_time_ms: float, frame_width: int, frame_height: int) -> DetectionResult:
+        """Convert (xyxy, confidences, class_ids) arrays into a DetectionResult"""
         detections = []
-
-        if len(results) > 0:
-            result = results[0]  # First image result
-
-            if result.boxes is not None and len(result.boxes) > 0:
-                boxes = result.boxes.cpu().numpy()
-
-                for box in boxes:
-                    # Extract box data
-                    x1, y1, x2, y2 = box.xyxy[0].tolist()
-                    confidence = float(box.conf[0])
-                    class_id = int(box.cls[0])
-
-                    # Get class name
-                    class_name = self.class_names[class_id] if class_id < len(self.class_names) else f"class_{class_id}"
-
-                    # Create detection object
-                    detection = Detection(
-                        class_id=class_id,
-                        class_name=class_name,
-                        confidence=confidence,
-                        bbox=[x1, y1, x2, y2],
-                        bbox_normalized=[
-                            x1 / frame_width,
-                            y1 / frame_height,
-                            x2 / frame_width,
-                            y2 / frame_height
-                        ]
+        person_count = 0
+
+        if boxes is not None and len(boxes[0]) > 0:
+            xyxy, confidences, class_ids = boxes
+
+            inv_wh = self._get_inv_wh(camera_id, frame_width, frame_height)
+            bboxes = xyxy.tolist()
+            bboxes_normalized = (xyxy * inv_wh).tolist()
+
+            # Gather class names in one shot; unknown ids get a class_N name
+            num_classes = len(self.class_names)
+            known = class_ids < num_classes
+            if known.all():
+                class_names = self._class_names_arr[class_ids].tolist()
+            else:
+                class_names = [
+                    name if ok else f"class_{class_id}"
+                    for name, ok, class_id in zip(
+                        self._class_names_arr[np.where(known, class_ids, 0)].tolist(),
+                        known.tolist(), class_ids.tolist()
                     )
-
-                    detections.append(detection)
+                ]
+
+            detections = [
+                Detection.fast_build(
+                    class_id=class_id,
+                    class_name=class_name,
+                    confidence=confidence,
+                    bbox=bbox,
+                    bbox_normalized=bbox_normalized
+                )
+                for class_id, class_name, confidence, bbox, bbox_normalized in zip(
+                    class_ids.tolist(), class_names, confidences.tolist(), bboxes, bboxes_normalized
+                )
+            ]
+            person_count = int(np.count_nonzero(class_ids == self._person_class_id))
 
         self.total_detections += len(detections)
 
-        return DetectionResult(
+        return DetectionResult.fast_build(
             camera_id=camera_id,
             timestamp=timestamp,
-            frame_number=self._frame_counter,
+            frame_number=frame_number,
             detections=detections,
             inference_time_ms=round(inference_time_ms, 2),
             frame_width=frame_width,
-            frame_height=frame_height
+            frame_height=frame_height,
+            person_count=person_count
         )
 
-    def detect_batch(self, frames: List[np.ndarray], camera_id: int) -> List[DetectionResult]:
-        """
-        Run detection on multiple frames (batch processing)
-
-        Args:
-            frames: List of OpenCV images
-            camera_id: Camera ID
-
-        Returns:
-            List of DetectionResult objects
-        """
-        results = []
-        for frame in frames:
-            result = self.detect(frame, camera_id)
-            results.append(result)
-
-        return results
+    def _get_inv_wh(self, camera_id: int, frame_width: int, frame_height: int) -> np.ndarray:
+        """Get cached [1/W, 1/H, 1/W, 1/H] for a camera's frame size"""
+        key = (camera_id, frame_width, frame_height)
+        inv_wh = self._inv_wh_cache.get(key)
+        if inv_wh is None:
+            inv_wh = np.array(
+                [1 / frame_width, 1 / frame_height, 1 / frame_width, 1 / frame_height],
+                dtype=np.float32
+            )
+            self._inv_wh_cache[key] = inv_wh
+        return inv_wh
 
     def get_stats(self) -> dict:
         """Get detector statistics"""
+        # Frames skipped by the motion gate add no inference time
+        inferred_frames = self._frame_counter - self.skipped_frames
         avg_inference_time = 0.0
-        if self._frame_counter > 0:
-            avg_inference_time = self.total_inference_time / self._frame_counter
+        if inferred_frames > 0:
+            avg_inference_time = self.total_inference_time / inferred_frames
 
         avg_fps = 0.0
         if avg_inference_time > 0:
@@ -189,6 +616,7 @@ class YOLODetector:
             "model_name": self.config.model_name,
             "device": self.config.device,
             "frames_processed": self._frame_counter,
+            "frames_skipped": self.skipped_frames,
             "total_detections": self.total_detections,
             "avg_inference_time_ms": round(avg_inference_time, 2),
             "avg_fps": round(avg_fps, 2)
@@ -199,9 +627,11 @@ class YOLODetector:
         self._frame_counter = 0
         self.total_detections = 0
         self.total_inference_time = 0.0
+        self.skipped_frames = 0
 
     def draw_detections(self, frame: np.ndarray, detections: List[Detection],
-                       show_confidence: bool = True, color: tuple = (0, 255, 0)) -> np.ndarray:
+                       show_confidence: bool = True, color: tuple = (0, 255, 0),
+                       inplace: bool = False) -> np.ndarray:
         """
         Draw detection boxes on frame
 
@@ -210,15 +640,19 @@ class YOLODetector:
             detections: List of Detection objects
             show_confidence: Show confidence score
             color: Box color (B, G, R)
+            inplace: Draw directly on frame instead of a copy
 
         Returns:
             Frame with drawn boxes
         """
-        frame_drawn = frame.copy()
+        frame_drawn = frame if inplace else frame.copy()
+
+        if not detections:
+            return frame_drawn
 
-        for det in detections:
-            x1, y1, x2, y2 = [int(coord) for coord in det.bbox]
+        boxes = np.array([det.bbox for det in detections], dtype=np.int32).tolist()
 
+        for det, (x1, y1, x2, y2) in zip(detections, boxes):
             # Draw bounding box
             cv2.rectangle(frame_drawn, (x1, y1), (x2, y2), color, 2)
 
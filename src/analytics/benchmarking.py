@@ -10,6 +10,11 @@ from dataclasses import dataclass
 from loguru import logger
 
 
+def _as_array(values: List[float]) -> np.ndarray:
+    """Convert metric values to float64 (callers compare float64 inputs against the statistics)"""
+    return np.asarray(values, dtype=np.float64)
+
+
 @dataclass
 class BenchmarkResult:
     """Benchmark comparison result"""
@@ -85,7 +90,8 @@ class Benchmarking:
         self,
         current_value: float,
         historical_values: List[float],
-        comparison_period: str = "all"  # all, recent_7days, recent_30days
+        comparison_period: str = "all",  # all, recent_7days, recent_30days
+        presorted: bool = False
     ) -> Dict[str, Any]:
         """
         Compare to historical performance
@@ -94,6 +100,8 @@ class Benchmarking:
             current_value: Current value
             historical_values: Historical values
             comparison_period: Period to compare against
+            presorted: Values are already sorted ascending (skip the sort;
+                apply any period filtering before sorting)
 
         Returns:
             Comparison results
@@ -107,14 +115,19 @@ class Benchmarking:
         elif comparison_period == "recent_30days" and len(historical_values) > 30:
             historical_values = historical_values[-30:]
 
-        mean = np.mean(historical_values)
-        median = np.median(historical_values)
-        std = np.std(historical_values)
-        min_val = np.min(historical_values)
-        max_val = np.max(historical_values)
+        arr = _as_array(historical_values)
+        if not presorted:
+            arr = np.sort(arr)
+
+        n = arr.size
+        mean = float(arr.mean())
+        median = float((arr[(n - 1) // 2] + arr[n // 2]) / 2)
+        std = float(arr.std())
+        min_val = float(arr[0])
+        max_val = float(arr[-1])
 
-        # Calculate percentile rank
-        percentile_rank = (sum(1 for v in historical_values if v <= current_value) / len(historical_values)) * 100
+        # Calculate percentile rank (binary search on sorted values)
+        percentile_rank = int(np.searchsorted(arr, current_value, side="right")) / n * 100
 
         # Determine trend
         if current_value > mean + std:
@@ -160,15 +173,15 @@ class Benchmarking:
         if not peer_values:
             return {"error": "No peer data"}
 
-        all_values = peer_values + [worker_value]
-        all_values_sorted = sorted(all_values, reverse=True)
+        peers = _as_array(peer_values)
 
-        rank = all_values_sorted.index(worker_value) + 1
-        total = len(all_values)
+        # Rank = 1 + number of peers strictly better (ties share a rank)
+        rank = int(np.count_nonzero(peers > worker_value)) + 1
+        total = peers.size + 1
 
-        peer_mean = np.mean(peer_values)
-        peer_median = np.median(peer_values)
-        peer_std = np.std(peer_values)
+        peer_mean = float(peers.mean())
+        peer_median = float(np.median(peers))
+        peer_std = float(peers.std())
 
         # Calculate percentile
         percentile = ((total - rank) / total) * 100
@@ -226,16 +239,20 @@ class Benchmarking:
         normalized_weights = {k: v / total_weight for k, v in weights.items()}
 
         # Calculate weighted score
-        weighted_score = sum(
-            metrics[k] * normalized_weights.get(k, 0)
-            for k in metrics.keys()
+        keys = list(metrics)
+        values = np.fromiter((metrics[k] for k in keys), dtype=np.float64, count=len(keys))
+        metric_weights = np.fromiter(
+            (normalized_weights.get(k, 0.0) for k in keys), dtype=np.float64, count=len(keys)
         )
+        weighted = values * metric_weights
+        weighted_score = float(weighted.sum())
 
         # Calculate contribution of each metric
-        contributions = {
-            k: round((metrics[k] * normalized_weights.get(k, 0) / weighted_score * 100) if weighted_score != 0 else 0, 2)
-            for k in metrics.keys()
-        }
+        if weighted_score != 0:
+            contribution_values = np.round(weighted / weighted_score * 100, 2).tolist()
+        else:
+            contribution_values = [0] * len(keys)
+        contributions = dict(zip(keys, contribution_values))
 
         return {
             "weighted_score": round(weighted_score, 2),
@@ -262,8 +279,11 @@ class Benchmarking:
         if len(values) < 2:
             return {"error": "Insufficient data"}
 
-        mean = np.mean(values)
-        std = np.std(values)
+        arr = _as_array(values)
+        mean = float(arr.mean())
+        std = float(arr.std())
+        min_val = float(arr.min())
+        max_val = float(arr.max())
         cv = (std / mean * 100) if mean != 0 else 0  # Coefficient of variation
 
         # Determine consistency level
@@ -279,8 +299,8 @@ class Benchmarking:
             consistency = "very_inconsistent"
 
         # Calculate consecutive differences
-        diffs = [abs(values[i] - values[i-1]) for i in range(1, len(values))]
-        avg_change = np.mean(diffs) if diffs else 0
+        diffs = np.abs(np.diff(arr))
+        avg_change = float(diffs.mean()) if diffs.size else 0.0
 
         return {
             "metric_name": metric_name,
@@ -288,9 +308,9 @@ class Benchmarking:
             "coefficient_of_variation": round(cv, 2),
             "mean": round(mean, 2),
             "std": round(std, 2),
-            "min": round(float(np.min(values)), 2),
-            "max": round(float(np.max(values)), 2),
-            "range": round(float(np.max(values) - np.min(values)), 2),
+            "min": round(min_val, 2),
+            "max": round(max_val, 2),
+            "range": round(max_val - min_val, 2),
             "average_consecutive_change": round(avg_change, 2),
             "data_points": len(values)
         }
@@ -5,11 +5,35 @@ Export analytics data to various formats (PDF, Excel, CSV, JSON).
 
 import json
 import csv
+import orjson
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Union
 from io import StringIO, BytesIO
 from loguru import logger
 
+_BAR = "=" * 80
+_BAR_LINE = _BAR + "\n"
+_INDENTS = tuple("  " * i for i in range(8))
+
+# Datetimes are passed through to default=str, keeping the "YYYY-MM-DD HH:MM:SS"
+# form of the former json.dumps(default=str) output instead of orjson's ISO "T" form
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+_JSON_OPTIONS_PRETTY = _JSON_OPTIONS | orjson.OPT_INDENT_2
+
+
+def _format_cell(value: Any) -> str:
+    """Format a CSV cell: nested values as JSON, None as empty, the rest via str()"""
+    if isinstance(value, (list, dict)):
+        return orjson.dumps(value, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
+    return str(value) if value is not None else ""
+
+
+class _EchoBuffer:
+    """File-like object whose write() returns the value (lets csv.writer emit rows as strings)"""
+
+    def write(self, value: str) -> str:
+        return value
+
 
 class ExportManager:
     """
@@ -31,6 +55,9 @@ class ExportManager:
         """
         Export data to JSON format
 
+        Output is UTF-8 (non-ASCII text is not \\u-escaped) and compact
+        separators are used when pretty is False.
+
         Args:
             data: Data to export
             pretty: Pretty print JSON
@@ -39,6 +66,11 @@ class ExportManager:
             JSON string
         """
         try:
+            return orjson.dumps(
+                data, default=str, option=_JSON_OPTIONS_PRETTY if pretty else _JSON_OPTIONS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; stdlib json handles them
             if pretty:
                 return json.dumps(data, indent=2, default=str)
             else:
@@ -70,21 +102,11 @@ class ExportManager:
             if columns is None:
                 columns = list(data[0].keys())
 
-            # Write CSV
+            # Write CSV (writerows runs the row loop in C)
             output = StringIO()
-            writer = csv.DictWriter(output, fieldnames=columns)
-            writer.writeheader()
-
-            for row in data:
-                # Convert non-string values
-                clean_row = {}
-                for col in columns:
-                    value = row.get(col, "")
-                    if isinstance(value, (list, dict)):
-                        clean_row[col] = json.dumps(value)
-                    else:
-                        clean_row[col] = str(value) if value is not None else ""
-                writer.writerow(clean_row)
+            writer = csv.writer(output)
+            writer.writerow(columns)
+            writer.writerows(self._iter_csv_cells(data, columns))
 
             return output.getvalue()
 
@@ -92,6 +114,40 @@ class ExportManager:
             logger.error(f"Error exporting to CSV: {e}")
             return f"Error: {str(e)}"
 
+    def iter_csv_rows(
+        self,
+        data: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """
+        Generate CSV output one line at a time (for streaming responses)
+
+        Args:
+            data: List of dictionaries
+            columns: Column names (if None, use all keys from first record)
+
+        Yields:
+            CSV lines, header first
+        """
+        if not data:
+            return
+
+        # Determine columns
+        if columns is None:
+            columns = list(data[0].keys())
+
+        writer = csv.writer(_EchoBuffer())
+        yield writer.writerow(columns)
+
+        for cells in self._iter_csv_cells(data, columns):
+            yield writer.writerow(cells)
+
+    def _iter_csv_cells(self, data: List[Dict[str, Any]], columns: List[str]) -> Iterator[List[str]]:
+        """Convert records to lists of CSV cell strings"""
+        # Checked per cell: a column may be scalar in one row and nested in another
+        for row in data:
+            yield [_format_cell(row.get(col, "")) for col in columns]
+
     def export_report_to_text(
         self,
         title: str,
@@ -110,22 +166,22 @@ class ExportManager:
             Formatted text report
         """
         try:
-            lines = []
-            lines.append("=" * 80)
-            lines.append(f" {title}")
-            lines.append("=" * 80)
-            lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            lines.append("")
+            buf = StringIO()
+            buf.write(_BAR_LINE)
+            buf.write(f" {title}\n")
+            buf.write(_BAR_LINE)
+            buf.write(f"Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n")
+            buf.write("\n")
 
             if format_type == "detailed":
-                lines.extend(self._format_dict_detailed(data))
+                buf.writelines(self._format_dict_detailed(data))
             else:
-                lines.extend(self._format_dict_simple(data))
+                buf.writelines(self._format_dict_simple(data))
 
-            lines.append("")
-            lines.append("=" * 80)
+            buf.write("\n")
+            buf.write(_BAR)
 
-            return "\n".join(lines)
+            return buf.getvalue()
 
         except Exception as e:
             logger.error(f"Error exporting report: {e}")
@@ -217,70 +273,77 @@ class ExportManager:
 
     def create_download_response(
         self,
-        content: str,
+        content: Union[str, bytes],
         filename: str,
-        content_type: str
+        content_type: str,
+        generated_at: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Create download response object
 
         Args:
-            content: File content
+            content: File content (str or already-encoded UTF-8 bytes)
             filename: Filename
             content_type: MIME content type
+            generated_at: Generation time (defaults to now; pass it when the
+                caller already has one, e.g. for the filename)
 
         Returns:
             Response object with download info
         """
+        if generated_at is None:
+            generated_at = datetime.now()
+
+        # Avoid re-encoding just to measure: bytes and ASCII-only str (the
+        # common case for JSON/CSV, flag checked in O(1)) have len == byte size
+        if isinstance(content, bytes) or content.isascii():
+            size_bytes = len(content)
+        else:
+            size_bytes = len(content.encode('utf-8'))
+
         return {
             "filename": filename,
             "content_type": content_type,
             "content": content,
-            "size_bytes": len(content.encode('utf-8')),
-            "generated_at": datetime.now().isoformat()
+            "size_bytes": size_bytes,
+            "generated_at": generated_at.isoformat()
         }
 
     # Helper methods
 
-    def _format_dict_simple(self, data: Dict[str, Any], indent: int = 0) -> List[str]:
-        """Format dictionary as simple text"""
-        lines = []
-        prefix = "  " * indent
+    def _format_dict_simple(self, data: Dict[str, Any], indent: int = 0) -> Iterator[str]:
+        """Format dictionary as simple text (yields lines)"""
+        prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
 
         for key, value in data.items():
             if isinstance(value, dict):
-                lines.append(f"{prefix}{key}:")
-                lines.extend(self._format_dict_simple(value, indent + 1))
+                yield f"{prefix}{key}:\n"
+                yield from self._format_dict_simple(value, indent + 1)
             elif isinstance(value, list):
-                lines.append(f"{prefix}{key}: {len(value)} items")
+                yield f"{prefix}{key}: {len(value)} items\n"
             else:
-                lines.append(f"{prefix}{key}: {value}")
-
-        return lines
+                yield f"{prefix}{key}: {value}\n"
 
-    def _format_dict_detailed(self, data: Dict[str, Any], indent: int = 0) -> List[str]:
-        """Format dictionary as detailed text"""
-        lines = []
-        prefix = "  " * indent
+    def _format_dict_detailed(self, data: Dict[str, Any], indent: int = 0) -> Iterator[str]:
+        """Format dictionary as detailed text (yields lines)"""
+        prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
 
         for key, value in data.items():
             if isinstance(value, dict):
-                lines.append(f"{prefix}[{key}]")
-                lines.extend(self._format_dict_detailed(value, indent + 1))
+                yield f"{prefix}[{key}]\n"
+                yield from self._format_dict_detailed(value, indent + 1)
             elif isinstance(value, list):
-                lines.append(f"{prefix}{key}:")
+                yield f"{prefix}{key}:\n"
                 for i, item in enumerate(value[:10]):  # Limit to first 10 items
                     if isinstance(item, dict):
-                        lines.append(f"{prefix}  Item {i+1}:")
-                        lines.extend(self._format_dict_simple(item, indent + 2))
+                        yield f"{prefix}  Item {i+1}:\n"
+                        yield from self._format_dict_simple(item, indent + 2)
                     else:
-                        lines.append(f"{prefix}  - {item}")
+                        yield f"{prefix}  - {item}\n"
                 if len(value) > 10:
-                    lines.append(f"{prefix}  ... and {len(value) - 10} more")
+                    yield f"{prefix}  ... and {len(value) - 10} more\n"
             else:
-                lines.append(f"{prefix}{key}: {value}")
-
-        return lines
+                yield f"{prefix}{key}: {value}\n"
 
 
 # Note: PDF Export requires additional dependencies
@@ -0,0 +1,76 @@
+"""
+Forecast Process Pool
+Small, lazily started process pool for large forecast fits.
+"""
+
+import os
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import SpawnContext, SpawnProcess
+from typing import Optional
+
+from loguru import logger
+
+# Forecast fits are short; a couple of workers is enough to get past the GIL
+MAX_WORKERS = min(2, os.cpu_count() or 1)
+
+
+class _WorkerProcess(SpawnProcess):
+    """
+    Spawned worker that does not re-run the parent's __main__
+
+    A spawn child normally re-executes the parent's main script (main.py,
+    which imports torch, facenet, easyocr, ...) before unpickling its task.
+    Hiding __main__ while the child's preparation data is built leaves the
+    worker with only the modules its tasks need (this package and numpy/scipy).
+    Forecast callables must therefore not be defined in __main__.
+    """
+
+    _launch_lock = threading.Lock()
+
+    @staticmethod
+    def _Popen(process_obj):
+        with _WorkerProcess._launch_lock:
+            main_module = sys.modules["__main__"]
+            sys.modules["__main__"] = types.ModuleType("__main__")
+            try:
+                return SpawnProcess._Popen(process_obj)
+            finally:
+                sys.modules["__main__"] = main_module
+
+
+class _WorkerContext(SpawnContext):
+    Process = _WorkerProcess
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_forecast_pool() -> ProcessPoolExecutor:
+    """
+    Get the forecast process pool, creating it on first use
+
+    Workers are spawned on demand by the executor, so nothing is started
+    until the first large forecast is submitted.
+
+    Returns:
+        Shared ProcessPoolExecutor
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=_WorkerContext())
+            logger.info(f"Forecast process pool created ({MAX_WORKERS} workers)")
+        return _pool
+
+
+def shutdown_forecast_pool():
+    """Shut the pool down (if it was ever created), cancelling queued fits"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
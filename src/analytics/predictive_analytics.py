@@ -3,10 +3,15 @@ Predictive Analytics
 Time-series forecasting and predictive models for productivity and output.
 """
 
+import math
 import numpy as np
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from bisect import bisect_left
+from scipy.signal import lfilter
+from scipy.special import erf
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Tuple, Union
+from dataclasses import dataclass, field
 from loguru import logger
 
 
@@ -21,6 +26,170 @@ class Forecast:
     model_type: str = "unknown"
 
 
+@dataclass(eq=False)  # field-wise == is ambiguous for ndarrays
+class ForecastSeries(Sequence):
+    """
+    Forecast for a whole horizon, one array per field (day i + 1 is index i)
+
+    Behaves as a read-only sequence of per-day Forecast objects (indexing,
+    len, iteration), as the former List[Forecast] return value did; endpoints
+    use rounded() / truncated() to convert each field in one vectorized call.
+    """
+    predicted: np.ndarray
+    confidence_lower: np.ndarray
+    confidence_upper: np.ndarray
+    confidence_level: float = 0.95
+    model_type: str = "unknown"
+    generated_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def empty(cls) -> "ForecastSeries":
+        """Forecast with no days (insufficient data or fitting error)"""
+        return cls(np.empty(0), np.empty(0), np.empty(0))
+
+    def __len__(self) -> int:
+        return self.predicted.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("forecast index out of range")
+
+        return Forecast(
+            predicted_value=float(self.predicted[index]),
+            confidence_lower=float(self.confidence_lower[index]),
+            confidence_upper=float(self.confidence_upper[index]),
+            confidence_level=self.confidence_level,
+            forecast_date=self.generated_at + timedelta(days=index + 1),
+            model_type=self.model_type
+        )
+
+    def __iter__(self) -> Iterator[Forecast]:
+        for day, (p, lo, hi) in enumerate(zip(
+            self.predicted.tolist(), self.confidence_lower.tolist(), self.confidence_upper.tolist()
+        ), start=1):
+            yield Forecast(
+                p, lo, hi, self.confidence_level, self.generated_at + timedelta(days=day), self.model_type
+            )
+
+    def rounded(self, decimals: int = 2) -> Tuple[List[float], List[float], List[float]]:
+        """(predicted, lower, upper) rounded to `decimals` as lists"""
+        return (
+            np.round(self.predicted, decimals).tolist(),
+            np.round(self.confidence_lower, decimals).tolist(),
+            np.round(self.confidence_upper, decimals).tolist()
+        )
+
+    def truncated(self) -> Tuple[List[int], List[int], List[int]]:
+        """(predicted, lower, upper) truncated to integers as lists"""
+        return (
+            self.predicted.astype(np.int64).tolist(),
+            self.confidence_lower.astype(np.int64).tolist(),
+            self.confidence_upper.astype(np.int64).tolist()
+        )
+
+
+_Z_95 = 1.96  # z-score for a 95% confidence interval
+
+# Anomaly severity: labels[i] applies when thresholds[i-1] < |z| <= thresholds[i]
+_SEVERITY_THRESHOLDS = (1.5, 2.0, 2.5, 3.0)
+_SEVERITY_THRESHOLDS_ARR = np.array(_SEVERITY_THRESHOLDS)
+_SEVERITY_LABELS = ("normal", "low", "medium", "high", "critical")
+
+_HISTORY_DTYPE = np.dtype([
+    ("productivity", np.float64),
+    ("efficiency", np.float64),
+    ("output", np.float64)
+])
+
+
+class _SeriesStats(NamedTuple):
+    """Time series as an array plus statistics reused across forecasts/trends"""
+    arr: np.ndarray
+    mean: float
+    std: float
+    n: int
+
+
+def _as_f64(data) -> np.ndarray:
+    """Return data as a contiguous float64 array, without copying if it already is one"""
+    if isinstance(data, np.ndarray) and data.dtype == np.float64 and data.flags.c_contiguous:
+        return data
+    return np.ascontiguousarray(data, dtype=np.float64)
+
+
+def forecast_date_strings(forecast_days: int) -> List[str]:
+    """
+    Dates of the forecast horizon (tomorrow onwards) as YYYY-MM-DD strings
+
+    Built as one datetime64[D] range and formatted in a single array cast.
+    """
+    start = np.datetime64(date.today(), "D") + 1
+    return np.arange(start, start + forecast_days).astype(str).tolist()
+
+
+def _series_stats(data: List[float]) -> _SeriesStats:
+    """Convert a series once and compute its mean/std"""
+    arr = _as_f64(data)
+    n = arr.size
+    if n == 0:
+        return _SeriesStats(arr, 0.0, 0.0, 0)
+
+    # Population std from the mean we already have (arr.std() would redo the mean)
+    mean = arr.sum() / n
+    dev = arr - mean
+    return _SeriesStats(arr, float(mean), float(np.sqrt(dev @ dev / n)), n)
+
+
+@dataclass
+class RunningStats:
+    """
+    Running mean/std of a growing series (Welford's online algorithm)
+
+    Lets repeated anomaly checks against a series that grows one point at a
+    time update the statistics in O(1) instead of rescanning the history.
+    std is the population std, matching _series_stats.
+    """
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_series(cls, data: List[float]) -> "RunningStats":
+        """Seed the running statistics from an existing series"""
+        stats = _series_stats(data)
+        return cls(stats.n, stats.mean, stats.std * stats.std * stats.n)
+
+    def update(self, value: float):
+        """Add one value"""
+        value = float(value)
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def extend(self, values: List[float]):
+        """Add several values (merges their batch statistics in one step)"""
+        batch = _series_stats(values)
+        if batch.n == 0:
+            return
+
+        n = self.n + batch.n
+        delta = batch.mean - self.mean
+        self.m2 += batch.std * batch.std * batch.n + delta * delta * self.n * batch.n / n
+        self.mean += delta * batch.n / n
+        self.n = n
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation"""
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+
 @dataclass
 class TrendAnalysis:
     """Trend analysis result"""
@@ -46,141 +215,132 @@ class PredictiveAnalytics:
 
     def forecast_productivity(
         self,
-        historical_data: List[float],
+        historical_data: Union[List[float], np.ndarray],
         forecast_days: int = 7,
         confidence_level: float = 0.95
-    ) -> List[Forecast]:
+    ) -> ForecastSeries:
         """
         Forecast future productivity values
 
         Args:
-            historical_data: Historical productivity values (time-ordered)
+            historical_data: Historical productivity values (time-ordered;
+                a float64 ndarray is used without conversion)
             forecast_days: Number of days to forecast
             confidence_level: Confidence level for intervals (default 0.95)
 
         Returns:
-            List of Forecast objects for each future day
+            ForecastSeries covering each future day
         """
-        if len(historical_data) < self.min_data_points:
+        return self._forecast_productivity_stats(
+            _series_stats(historical_data), forecast_days, confidence_level
+        )
+
+    def _forecast_productivity_stats(
+        self,
+        stats: "_SeriesStats",
+        forecast_days: int = 7,
+        confidence_level: float = 0.95
+    ) -> ForecastSeries:
+        """Forecast productivity from precomputed series stats"""
+        if stats.n < self.min_data_points:
             logger.warning(f"Insufficient data for forecasting (need {self.min_data_points})")
-            return []
+            return ForecastSeries.empty()
 
         try:
             # Use exponential smoothing for forecasting
-            forecasts = []
             alpha = 0.3  # Smoothing parameter
 
             # Calculate smoothed series
-            smoothed = self._exponential_smoothing(historical_data, alpha)
+            smoothed = self._exponential_smoothing(stats.arr, alpha)
 
             # Calculate trend
             trend = self._calculate_trend(smoothed)
 
-            # Standard deviation for confidence intervals
-            std_dev = np.std(historical_data)
-
-            # Forecast future values
-            last_value = smoothed[-1]
-            for day in range(1, forecast_days + 1):
-                # Forecast with trend
-                predicted = last_value + (trend * day)
-
-                # Confidence intervals (wider as we go further)
-                margin = 1.96 * std_dev * np.sqrt(day)  # 95% CI
-
-                forecast = Forecast(
-                    predicted_value=max(0, predicted),  # Can't be negative
-                    confidence_lower=max(0, predicted - margin),
-                    confidence_upper=min(100, predicted + margin),  # Cap at 100
-                    confidence_level=confidence_level,
-                    forecast_date=datetime.now() + timedelta(days=day),
-                    model_type="exponential_smoothing"
-                )
-                forecasts.append(forecast)
-
-            return forecasts
+            # Forecast future values (confidence intervals capped at 100)
+            return self._build_forecasts(
+                smoothed[-1], trend, stats.std, forecast_days, confidence_level,
+                model_type="exponential_smoothing", upper_cap=100.0
+            )
 
         except Exception as e:
             logger.error(f"Error forecasting productivity: {e}")
-            return []
+            return ForecastSeries.empty()
 
     def forecast_output(
         self,
-        historical_output: List[int],
+        historical_output: Union[List[int], np.ndarray],
         forecast_days: int = 7,
         confidence_level: float = 0.95
-    ) -> List[Forecast]:
+    ) -> ForecastSeries:
         """
         Forecast future output values
 
         Args:
-            historical_output: Historical output values (units produced)
+            historical_output: Historical output values (units produced; list or ndarray)
             forecast_days: Number of days to forecast
             confidence_level: Confidence level for intervals
 
         Returns:
-            List of Forecast objects for each future day
+            ForecastSeries covering each future day
         """
-        if len(historical_output) < self.min_data_points:
+        return self._forecast_output_stats(
+            _series_stats(historical_output), forecast_days, confidence_level
+        )
+
+    def _forecast_output_stats(
+        self,
+        stats: "_SeriesStats",
+        forecast_days: int = 7,
+        confidence_level: float = 0.95
+    ) -> ForecastSeries:
+        """Forecast output from precomputed series stats"""
+        if stats.n < self.min_data_points:
             logger.warning(f"Insufficient data for output forecasting")
-            return []
+            return ForecastSeries.empty()
 
         try:
             # Use moving average with trend
-            forecasts = []
-
-            # Calculate moving average
-            window_size = min(7, len(historical_output))
-            moving_avg = self._moving_average(historical_output, window_size)
+            window_size = min(7, stats.n)
+            moving_avg = self._moving_average(stats.arr, window_size)
 
             # Calculate trend from recent data
-            recent_data = historical_output[-window_size:]
+            recent_data = stats.arr[-window_size:]
             trend = self._calculate_trend(recent_data)
 
-            # Standard deviation for confidence intervals
-            std_dev = np.std(historical_output)
-
             # Forecast future values
-            last_value = moving_avg[-1]
-            for day in range(1, forecast_days + 1):
-                # Forecast with trend
-                predicted = last_value + (trend * day)
-
-                # Confidence intervals
-                margin = 1.96 * std_dev * np.sqrt(day)
-
-                forecast = Forecast(
-                    predicted_value=max(0, predicted),
-                    confidence_lower=max(0, predicted - margin),
-                    confidence_upper=predicted + margin,
-                    confidence_level=confidence_level,
-                    forecast_date=datetime.now() + timedelta(days=day),
-                    model_type="moving_average_with_trend"
-                )
-                forecasts.append(forecast)
-
-            return forecasts
+            return self._build_forecasts(
+                moving_avg[-1], trend, stats.std, forecast_days, confidence_level,
+                model_type="moving_average_with_trend"
+            )
 
         except Exception as e:
             logger.error(f"Error forecasting output: {e}")
-            return []
+            return ForecastSeries.empty()
 
     def analyze_trend(
         self,
-        time_series_data: List[float],
+        time_series_data: Union[List[float], np.ndarray],
         data_type: str = "productivity"
     ) -> TrendAnalysis:
         """
         Analyze trend in time-series data
 
         Args:
-            time_series_data: Time-ordered data points
+            time_series_data: Time-ordered data points (list or float64 ndarray)
             data_type: Type of data (productivity, output, efficiency)
 
         Returns:
             TrendAnalysis object with trend information
         """
-        if len(time_series_data) < self.min_data_points:
+        return self._analyze_trend_stats(_series_stats(time_series_data), data_type)
+
+    def _analyze_trend_stats(
+        self,
+        stats: "_SeriesStats",
+        data_type: str = "productivity"
+    ) -> TrendAnalysis:
+        """Analyze trend from precomputed series stats"""
+        if stats.n < self.min_data_points:
             return TrendAnalysis(
                 trend="unknown",
                 slope=0.0,
@@ -191,12 +351,16 @@ class PredictiveAnalytics:
 
         try:
             # Linear regression for trend
-            n = len(time_series_data)
-            x = np.arange(n)
-            y = np.array(time_series_data)
+            n = stats.n
 
-            # Calculate slope and intercept
-            slope, intercept, r_squared = self._linear_regression(x, y)
+            if stats.std == 0:
+                # Constant series: flat trend, skip the regression entirely
+                slope, intercept, r_squared = 0.0, stats.mean, 0.0
+            else:
+                # Calculate slope and intercept (Syy from the std we already have)
+                slope, intercept, r_squared = self._time_regression(
+                    stats.arr, y_mean=stats.mean, syy=n * stats.std * stats.std
+                )
 
             # Determine trend direction
             if abs(slope) < 0.1:
@@ -254,44 +418,130 @@ class PredictiveAnalytics:
             }
 
         try:
-            mean = np.mean(historical_data)
-            std = np.std(historical_data)
+            stats = _series_stats(historical_data)
+            return self._score_anomaly(current_value, stats.mean, stats.std, threshold_std)
 
-            if std == 0:
-                return {
-                    "is_anomaly": False,
-                    "probability": 0.0,
-                    "z_score": 0.0,
-                    "reason": "no_variance"
-                }
+        except Exception as e:
+            logger.error(f"Error predicting anomaly: {e}")
+            return {
+                "is_anomaly": False,
+                "probability": 0.0,
+                "z_score": 0.0,
+                "reason": f"error: {str(e)}"
+            }
 
-            # Calculate z-score
-            z_score = (current_value - mean) / std
+    def predict_anomaly_from_stats(
+        self,
+        current_value: float,
+        stats: RunningStats,
+        threshold_std: float = 2.0
+    ) -> Dict[str, Any]:
+        """
+        Predict probability of anomaly against running statistics
 
-            # Probability based on z-score (using normal distribution)
-            probability = 1 - np.exp(-abs(z_score) / 2)
+        O(1) per check: the history is summarized by a RunningStats that the
+        caller updates as new points arrive.
 
-            is_anomaly = abs(z_score) > threshold_std
+        Args:
+            current_value: Current value to check
+            stats: Running statistics of the historical values
+            threshold_std: Standard deviation threshold
 
+        Returns:
+            Dictionary with anomaly probability and details
+        """
+        if stats.n < self.min_data_points:
             return {
-                "is_anomaly": is_anomaly,
-                "probability": probability,
-                "z_score": z_score,
-                "mean": mean,
-                "std": std,
-                "deviation_percent": ((current_value - mean) / mean) * 100 if mean != 0 else 0,
-                "severity": self._get_anomaly_severity(abs(z_score))
+                "is_anomaly": False,
+                "probability": 0.0,
+                "z_score": 0.0,
+                "reason": "insufficient_data"
             }
 
-        except Exception as e:
-            logger.error(f"Error predicting anomaly: {e}")
+        return self._score_anomaly(current_value, stats.mean, stats.std, threshold_std)
+
+    def _score_anomaly(
+        self,
+        current_value: float,
+        mean: float,
+        std: float,
+        threshold_std: float
+    ) -> Dict[str, Any]:
+        """Score a single value against a historical mean/std"""
+        if std == 0:
             return {
                 "is_anomaly": False,
                 "probability": 0.0,
                 "z_score": 0.0,
-                "reason": f"error: {str(e)}"
+                "reason": "no_variance"
             }
 
+        z_score = (current_value - mean) / std
+        abs_z = abs(z_score)
+
+        return {
+            "is_anomaly": abs_z > threshold_std,
+            # Normal mass within ±|z|, i.e. 1 - two-sided tail p-value
+            "probability": math.erf(abs_z / math.sqrt(2.0)),
+            "z_score": z_score,
+            "mean": mean,
+            "std": std,
+            "deviation_percent": (current_value - mean) / mean * 100 if mean != 0 else 0,
+            "severity": self._get_anomaly_severity(abs_z)
+        }
+
+    def predict_anomaly_probabilities(
+        self,
+        current_values: List[float],
+        historical_data: List[float],
+        threshold_std: float = 2.0
+    ) -> Dict[str, Any]:
+        """
+        Predict anomaly probability for several values against the same history
+
+        Historical mean/std are computed once and all values are scored in
+        one vectorized pass.
+
+        Args:
+            current_values: Values to check
+            historical_data: Historical values for comparison
+            threshold_std: Standard deviation threshold
+
+        Returns:
+            Dictionary with historical mean/std and per-value lists
+            (is_anomaly, probability, z_score, deviation_percent, severity)
+        """
+        stats = _series_stats(historical_data)
+        values = _as_f64(current_values)
+
+        if stats.n < self.min_data_points:
+            return {"mean": stats.mean, "std": stats.std, "reason": "insufficient_data"}
+
+        if stats.std == 0:
+            return {"mean": stats.mean, "std": 0.0, "reason": "no_variance"}
+
+        # Calculate z-scores
+        z_scores = (values - stats.mean) / stats.std
+        abs_z = np.abs(z_scores)
+
+        # Probability based on z-score: normal mass within ±|z|, i.e. 1 - two-sided tail p-value
+        probabilities = erf(abs_z / np.sqrt(2.0))
+
+        if stats.mean != 0:
+            deviation_percent = ((values - stats.mean) / stats.mean * 100).tolist()
+        else:
+            deviation_percent = [0] * values.size
+
+        return {
+            "mean": stats.mean,
+            "std": stats.std,
+            "is_anomaly": (abs_z > threshold_std).tolist(),
+            "probability": probabilities.tolist(),
+            "z_score": z_scores.tolist(),
+            "deviation_percent": deviation_percent,
+            "severity": self._get_anomaly_severity_arr(abs_z)
+        }
+
     def predict_worker_performance(
         self,
         worker_history: List[Dict[str, float]],
@@ -316,57 +566,76 @@ class PredictiveAnalytics:
             }
 
         try:
-            # Extract time series for each metric
-            productivity_series = [r.get("productivity", 0) for r in worker_history]
-            efficiency_series = [r.get("efficiency", 0) for r in worker_history]
-            output_series = [r.get("output", 0) for r in worker_history]
+            # Extract all metric series in a single pass over the records
+            records = np.fromiter(
+                ((r.get("productivity", 0), r.get("efficiency", 0), r.get("output", 0)) for r in worker_history),
+                dtype=_HISTORY_DTYPE,
+                count=len(worker_history)
+            )
+
+            # fromiter turns None into NaN, which would yield NaN forecasts and trends
+            missing = [name for name in _HISTORY_DTYPE.names if np.isnan(records[name]).any()]
+            if missing:
+                return {
+                    "error": f"Missing values in historical data: {', '.join(missing)}",
+                    "data_points": len(worker_history)
+                }
+
+            # Array + mean/std computed once per metric
+            productivity_stats = _series_stats(records["productivity"])
+            efficiency_stats = _series_stats(records["efficiency"])
+            output_stats = _series_stats(records["output"])
 
             # Forecast each metric
-            productivity_forecast = self.forecast_productivity(productivity_series, forecast_days)
-            output_forecast = self.forecast_output(output_series, forecast_days)
-            efficiency_forecast = self.forecast_productivity(efficiency_series, forecast_days)
+            productivity_forecast = self._forecast_productivity_stats(productivity_stats, forecast_days)
+            output_forecast = self._forecast_output_stats(output_stats, forecast_days)
+            efficiency_forecast = self._forecast_productivity_stats(efficiency_stats, forecast_days)
 
             # Analyze trends
-            productivity_trend = self.analyze_trend(productivity_series, "productivity")
-            efficiency_trend = self.analyze_trend(efficiency_series, "efficiency")
+            productivity_trend = self._analyze_trend_stats(productivity_stats, "productivity")
+            efficiency_trend = self._analyze_trend_stats(efficiency_stats, "efficiency")
 
             # Calculate performance score
-            recent_productivity = np.mean(productivity_series[-7:]) if len(productivity_series) >= 7 else np.mean(productivity_series)
-            predicted_productivity = productivity_forecast[0].predicted_value if productivity_forecast else recent_productivity
+            if productivity_stats.n >= 7:
+                recent_productivity = float(productivity_stats.arr[-7:].mean())
+            else:
+                recent_productivity = productivity_stats.mean
+            predicted_productivity = float(productivity_forecast.predicted[0]) if productivity_forecast else recent_productivity
 
             performance_change = predicted_productivity - recent_productivity
+            dates = forecast_date_strings(forecast_days)
 
             return {
                 "forecasts": {
                     "productivity": [
                         {
                             "day": i + 1,
-                            "date": f.forecast_date.strftime("%Y-%m-%d") if f.forecast_date else None,
-                            "predicted": round(f.predicted_value, 2),
-                            "confidence_lower": round(f.confidence_lower, 2),
-                            "confidence_upper": round(f.confidence_upper, 2)
+                            "date": d,
+                            "predicted": p,
+                            "confidence_lower": lo,
+                            "confidence_upper": hi
                         }
-                        for i, f in enumerate(productivity_forecast)
+                        for i, (d, p, lo, hi) in enumerate(zip(dates, *productivity_forecast.rounded(2)))
                     ],
                     "output": [
                         {
                             "day": i + 1,
-                            "date": f.forecast_date.strftime("%Y-%m-%d") if f.forecast_date else None,
-                            "predicted": int(f.predicted_value),
-                            "confidence_lower": int(f.confidence_lower),
-                            "confidence_upper": int(f.confidence_upper)
+                            "date": d,
+                            "predicted": p,
+                            "confidence_lower": lo,
+                            "confidence_upper": hi
                         }
-                        for i, f in enumerate(output_forecast)
+                        for i, (d, p, lo, hi) in enumerate(zip(dates, *output_forecast.truncated()))
                     ],
                     "efficiency": [
                         {
                             "day": i + 1,
-                            "date": f.forecast_date.strftime("%Y-%m-%d") if f.forecast_date else None,
-                            "predicted": round(f.predicted_value, 2),
-                            "confidence_lower": round(f.confidence_lower, 2),
-                            "confidence_upper": round(f.confidence_upper, 2)
+                            "date": d,
+                            "predicted": p,
+                            "confidence_lower": lo,
+                            "confidence_upper": hi
                         }
-                        for i, f in enumerate(efficiency_forecast)
+                        for i, (d, p, lo, hi) in enumerate(zip(dates, *efficiency_forecast.rounded(2)))
                     ]
                 },
                 "trends": {
@@ -398,87 +667,108 @@ class PredictiveAnalytics:
 
     # Helper methods
 
-    def _exponential_smoothing(self, data: List[float], alpha: float) -> List[float]:
-        """Apply exponential smoothing"""
-        smoothed = [data[0]]
-        for i in range(1, len(data)):
-            smoothed.append(alpha * data[i] + (1 - alpha) * smoothed[i - 1])
+    def _build_forecasts(
+        self,
+        last_value: float,
+        trend: float,
+        std_dev: float,
+        forecast_days: int,
+        confidence_level: float,
+        model_type: str,
+        upper_cap: Optional[float] = None
+    ) -> ForecastSeries:
+        """Build the forecast for the whole horizon at once"""
+        days = np.arange(1, forecast_days + 1, dtype=np.float64)
+        predicted = last_value + trend * days
+
+        # 95% CI, wider as we go further (scalar factor folded before the array multiply)
+        margin = np.sqrt(days)
+        margin *= _Z_95 * std_dev
+        lower = np.maximum(0.0, predicted - margin)
+        upper = predicted + margin
+        if upper_cap is not None:
+            upper = np.minimum(upper_cap, upper)
+
+        predicted_clipped = np.maximum(0.0, predicted)  # Can't be negative
+
+        return ForecastSeries(predicted_clipped, lower, upper, confidence_level, model_type)
+
+    def _exponential_smoothing(self, x: np.ndarray, alpha: float) -> np.ndarray:
+        """Apply exponential smoothing (x: float64 array)"""
+        # s[i] = alpha * x[i] + (1 - alpha) * s[i-1] as an IIR filter, seeded so s[0] = x[0]
+        smoothed, _ = lfilter([alpha], [1.0, alpha - 1.0], x, zi=[x[0] * (1 - alpha)])
         return smoothed
 
-    def _moving_average(self, data: List[float], window_size: int) -> List[float]:
-        """Calculate moving average"""
-        if len(data) < window_size:
-            return [np.mean(data)]
+    def _moving_average(self, x: np.ndarray, window_size: int) -> List[float]:
+        """Calculate moving average (x: float64 array)"""
+        if x.size < window_size:
+            return [float(x.mean())]
 
-        moving_avg = []
-        for i in range(len(data) - window_size + 1):
-            window = data[i:i + window_size]
-            moving_avg.append(np.mean(window))
-        return moving_avg
+        # Window sums from differences of the cumulative sum
+        cumsum = np.cumsum(np.concatenate(([0.0], x)))
+        return ((cumsum[window_size:] - cumsum[:-window_size]) / window_size).tolist()
 
-    def _calculate_trend(self, data: List[float]) -> float:
-        """Calculate linear trend (slope)"""
-        if len(data) < 2:
+    def _calculate_trend(self, y: np.ndarray) -> float:
+        """Calculate linear trend (slope) of a float64 array"""
+        if y.size < 2:
             return 0.0
 
-        n = len(data)
-        x = np.arange(n)
-        y = np.array(data)
-
-        # Calculate slope
-        x_mean = np.mean(x)
-        y_mean = np.mean(y)
-
-        numerator = np.sum((x - x_mean) * (y - y_mean))
-        denominator = np.sum((x - x_mean) ** 2)
-
-        if denominator == 0:
-            return 0.0
-
-        slope = numerator / denominator
+        slope, _, _ = self._time_regression(y)
         return slope
 
-    def _linear_regression(
+    def _time_regression(
         self,
-        x: np.ndarray,
-        y: np.ndarray
+        y: np.ndarray,
+        y_mean: Optional[float] = None,
+        syy: Optional[float] = None
     ) -> Tuple[float, float, float]:
         """
-        Perform linear regression
+        Linear regression of y on t = 0..n-1
+
+        The time axis has closed-form moments (mean (n-1)/2,
+        Sxx = n(n²-1)/12), so the fit needs a single dot product over y.
+
+        Args:
+            y: Float64 series
+            y_mean: Precomputed mean of y (skips a pass if known)
+            syy: Precomputed sum of squared deviations of y
 
         Returns:
             (slope, intercept, r_squared)
         """
-        x_mean = np.mean(x)
-        y_mean = np.mean(y)
+        n = y.size
+        if y_mean is None:
+            y_mean = y.sum() / n
+        if syy is None:
+            y_dev = y - y_mean
+            syy = y_dev @ y_dev
 
-        numerator = np.sum((x - x_mean) * (y - y_mean))
-        denominator = np.sum((x - x_mean) ** 2)
+        # Single point or constant y (e.g. an idle worker): flat line, nothing to fit
+        if n < 2 or syy == 0:
+            return 0.0, float(y_mean), 0.0
 
-        if denominator == 0:
-            return 0.0, y_mean, 0.0
+        t_mean = (n - 1) / 2
+        sxx = n * (n * n - 1) / 12
 
-        slope = numerator / denominator
-        intercept = y_mean - slope * x_mean
+        # Centered time axis: sum(t_dev) == 0, so t_dev @ y == Sxy
+        t_dev = np.arange(n, dtype=np.float64)
+        t_dev -= t_mean
+        sxy = t_dev @ y
 
-        # Calculate R²
-        y_pred = slope * x + intercept
-        ss_res = np.sum((y - y_pred) ** 2)
-        ss_tot = np.sum((y - y_mean) ** 2)
+        slope = sxy / sxx
+        intercept = y_mean - slope * t_mean
 
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0.0
+        # R² = Sxy² / (Sxx·Syy), no prediction array needed
+        r_squared = (sxy * sxy) / (sxx * syy)
 
-        return slope, intercept, r_squared
+        return float(slope), float(intercept), float(r_squared)
 
     def _get_anomaly_severity(self, z_score: float) -> str:
         """Get anomaly severity based on z-score"""
-        if z_score > 3.0:
-            return "critical"
-        elif z_score > 2.5:
-            return "high"
-        elif z_score > 2.0:
-            return "medium"
-        elif z_score > 1.5:
-            return "low"
-        else:
-            return "normal"
+        # Thresholds are exclusive (z > 3.0 is critical), hence bisect_left
+        return _SEVERITY_LABELS[bisect_left(_SEVERITY_THRESHOLDS, z_score)]
+
+    def _get_anomaly_severity_arr(self, z_scores: np.ndarray) -> List[str]:
+        """Get anomaly severities for an array of absolute z-scores"""
+        indices = np.searchsorted(_SEVERITY_THRESHOLDS_ARR, z_scores, side="left")
+        return [_SEVERITY_LABELS[i] for i in indices.tolist()]
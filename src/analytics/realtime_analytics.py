@@ -4,14 +4,32 @@ Provides real-time analytics updates via WebSocket connections.
 """
 
 import asyncio
-import json
+from collections import deque
+from itertools import islice
+import orjson
 from datetime import datetime
-from typing import Dict, List, Set, Any, Optional
+from typing import Deque, Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from enum import Enum
 import numpy as np
 from loguru import logger
 
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# WebSocket close code sent to clients dropped for falling behind
+_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize an event payload to UTF-8 JSON bytes"""
+    return orjson.dumps(obj, default=str, option=_JSON_OPTIONS)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an event payload to a JSON string"""
+    return _dumps_bytes(obj).decode()
+
 
 class EventType(str, Enum):
     """Real-time event types"""
@@ -23,6 +41,10 @@ class EventType(str, Enum):
     METRICS_SNAPSHOT = "metrics_snapshot"
 
 
+# Plain-dict lookup instead of the Enum .value descriptor on every serialization
+_EVENT_TYPE_VALUES = {e: e.value for e in EventType}
+
+
 @dataclass
 class RealtimeEvent:
     """Real-time event data structure"""
@@ -31,18 +53,29 @@ class RealtimeEvent:
     data: Dict[str, Any]
     severity: str = "info"  # info, warning, critical
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+    @cached_property
+    def _dict(self) -> Dict[str, Any]:
         return {
-            "event_type": self.event_type.value,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
             "timestamp": self.timestamp.isoformat(),
             "data": self.data,
             "severity": self.severity
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (built once per event, reused for history)"""
+        return self._dict
+
+    # orjson encodes the dataclass fields (enum, datetime included) natively,
+    # so serialization does not need the intermediate dict
+
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        return _dumps(self)
+
+    def to_bytes(self) -> bytes:
+        """Convert to UTF-8 JSON bytes"""
+        return _dumps_bytes(self)
 
 
 class RealtimeAnalytics:
@@ -52,12 +85,25 @@ class RealtimeAnalytics:
     Manages WebSocket connections and broadcasts real-time analytics updates.
     """
 
-    def __init__(self):
-        """Initialize real-time analytics manager"""
-        self.active_connections: Set[Any] = set()
+    def __init__(self, binary_frames: bool = False):
+        """
+        Initialize real-time analytics manager
+
+        Args:
+            binary_frames: Send events as binary frames of UTF-8 JSON (skips the
+                per-send text encode; clients must decode binary messages)
+        """
+        self.binary_frames = binary_frames
+        self._serialize = _dumps_bytes if binary_frames else _dumps
+        # websocket -> (outgoing queue, writer task)
+        self.active_connections: Dict[Any, Tuple[asyncio.Queue, asyncio.Task]] = {}
         self.event_queue: asyncio.Queue = asyncio.Queue()
         self.is_running = False
         self.broadcast_task: Optional[asyncio.Task] = None
+        self.send_timeout = 5.0  # Per-client send timeout (seconds)
+        self.client_queue_size = 256  # Pending payloads before a client counts as too slow
+        self.max_batch_size = 64  # Events coalesced into one broadcast
+        self.max_batch_interval = 0.02  # Seconds to wait for a burst to accumulate
 
         # Metrics cache
         self.current_metrics: Dict[str, Any] = {
@@ -70,8 +116,13 @@ class RealtimeAnalytics:
         }
 
         # Event history (keep last 100 events)
-        self.event_history: List[RealtimeEvent] = []
         self.max_history = 100
+        self.event_history: Deque[RealtimeEvent] = deque(maxlen=self.max_history)
+        # Same events indexed by type, so filtered history is a tail slice
+        # (each type keeps its own last max_history events)
+        self.event_history_by_type: Dict[EventType, Deque[RealtimeEvent]] = {
+            event_type: deque(maxlen=self.max_history) for event_type in EventType
+        }
 
         logger.info("Real-time Analytics Manager initialized")
 
@@ -97,7 +148,7 @@ class RealtimeAnalytics:
                 pass
 
         # Close all connections
-        for connection in self.active_connections.copy():
+        for connection in list(self.active_connections):
             await self.disconnect(connection)
 
         logger.info("Real-time analytics stopped")
@@ -109,30 +160,44 @@ class RealtimeAnalytics:
         Args:
             websocket: WebSocket connection object
         """
-        self.active_connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.client_queue_size)
+        task = asyncio.create_task(self._client_writer(websocket, queue))
+        self.active_connections[websocket] = (queue, task)
         logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
 
-        # Send current metrics immediately
-        await self._send_to_client(
-            websocket,
-            RealtimeEvent(
-                event_type=EventType.METRICS_SNAPSHOT,
-                timestamp=datetime.now(),
-                data=self.current_metrics,
-                severity="info"
-            )
+        # Send current metrics immediately (queued first, so it precedes any broadcast)
+        snapshot = RealtimeEvent(
+            event_type=EventType.METRICS_SNAPSHOT,
+            timestamp=datetime.now(),
+            data=self.current_metrics,
+            severity="info"
         )
+        queue.put_nowait(self._serialize(snapshot))
 
-    async def disconnect(self, websocket: Any):
+    async def disconnect(self, websocket: Any, close_code: Optional[int] = None):
         """
         Unregister a WebSocket connection
 
         Args:
             websocket: WebSocket connection object
+            close_code: If given, also close the socket with this code (used when
+                the server drops a client, so it sees the close and reconnects)
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
+        entry = self.active_connections.pop(websocket, None)
+        if entry is None:
+            return
+
+        _, task = entry
+        if task is not asyncio.current_task():
+            task.cancel()
+
+        if close_code is not None:
+            try:
+                await asyncio.wait_for(websocket.close(code=close_code), timeout=self.send_timeout)
+            except Exception as e:
+                logger.debug(f"Closing dropped client failed: {e}")
+
+        logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
 
     async def publish_event(self, event: RealtimeEvent):
         """
@@ -141,13 +206,13 @@ class RealtimeAnalytics:
         Args:
             event: RealtimeEvent to publish
         """
-        # Add to history
+        # Add to history (deque evicts the oldest event)
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
+        self.event_history_by_type[event.event_type].append(event)
 
-        # Add to queue for broadcasting
-        await self.event_queue.put(event)
+        # Add to queue for broadcasting (nobody to send to without clients)
+        if self.active_connections:
+            await self.event_queue.put(event)
 
     async def update_worker_status(
         self,
@@ -212,7 +277,7 @@ class RealtimeAnalytics:
         await self.publish_event(event)
 
         # Update global metrics
-        await self._update_global_metrics()
+        await self._update_global_metrics(event.to_dict()["timestamp"])
 
     async def publish_zone_transition(
         self,
@@ -322,13 +387,11 @@ class RealtimeAnalytics:
         Returns:
             List of event dictionaries
         """
-        events = self.event_history
-
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
+        history = self.event_history_by_type[event_type] if event_type else self.event_history
 
         # Get last N events
-        events = events[-limit:]
+        start = max(0, len(history) - limit) if limit else 0
+        events = islice(history, start, None)
 
         return [e.to_dict() for e in events]
 
@@ -343,8 +406,19 @@ class RealtimeAnalytics:
                         timeout=1.0
                     )
 
+                    # Coalesce whatever else is already waiting into one send
+                    batch = [event]
+                    self._drain_events(batch)
+                    if len(batch) == 1:
+                        # Give a burst a moment to accumulate
+                        await asyncio.sleep(self.max_batch_interval)
+                        self._drain_events(batch)
+
                     # Broadcast to all connected clients
-                    await self._broadcast_to_all(event)
+                    if len(batch) == 1:
+                        await self._broadcast_to_all(event)
+                    else:
+                        await self._broadcast_payload(self._serialize(batch))
 
                 except asyncio.TimeoutError:
                     # No events in queue, continue
@@ -368,18 +442,57 @@ class RealtimeAnalytics:
         if not self.active_connections:
             return
 
-        # Send to all clients
-        disconnected = []
-        for connection in self.active_connections:
+        # Serialize once for all clients
+        await self._broadcast_payload(self._serialize(event))
+
+    def _drain_events(self, batch: List[RealtimeEvent]):
+        """Move already-queued events into batch (up to max_batch_size)"""
+        while len(batch) < self.max_batch_size and not self.event_queue.empty():
+            batch.append(self.event_queue.get_nowait())
+
+    async def _broadcast_payload(self, payload: Union[str, bytes]):
+        """
+        Queue a serialized payload (one event or a JSON array of events) for every client
+
+        Args:
+            payload: JSON string (or bytes in binary_frames mode) to send
+        """
+        if not self.active_connections:
+            return
+
+        # Hand off to each client's writer; never wait on a slow client here
+        slow = []
+        for connection, (queue, _) in self.active_connections.items():
             try:
-                await self._send_to_client(connection, event)
-            except Exception as e:
-                logger.warning(f"Failed to send to client: {e}")
-                disconnected.append(connection)
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                slow.append(connection)
 
-        # Remove disconnected clients
-        for connection in disconnected:
-            await self.disconnect(connection)
+        # Drop clients that cannot keep up
+        for connection in slow:
+            logger.warning("Client send queue full, disconnecting slow client")
+            await self.disconnect(connection, close_code=_CLOSE_TRY_AGAIN_LATER)
+
+    async def _client_writer(self, websocket: Any, queue: asyncio.Queue):
+        """
+        Per-connection task draining the client's queue onto its socket
+
+        Args:
+            websocket: WebSocket connection
+            queue: Outgoing payload queue for this connection
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                await asyncio.wait_for(
+                    self._send_prepared(websocket, payload),
+                    timeout=self.send_timeout
+                )
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to send to client: {e}")
+            await self.disconnect(websocket, close_code=_CLOSE_TRY_AGAIN_LATER)
 
     async def _send_to_client(self, websocket: Any, event: RealtimeEvent):
         """
@@ -389,17 +502,36 @@ class RealtimeAnalytics:
             websocket: WebSocket connection
             event: RealtimeEvent to send
         """
+        await self._send_prepared(websocket, self._serialize(event))
+
+    async def _send_prepared(self, websocket: Any, payload: Union[str, bytes]):
+        """
+        Send an already-serialized event to a specific client
+
+        Args:
+            websocket: WebSocket connection
+            payload: JSON string (text frame) or UTF-8 JSON bytes (binary frame)
+        """
         try:
-            await websocket.send_text(event.to_json())
+            if isinstance(payload, bytes):
+                await websocket.send_bytes(payload)
+            else:
+                await websocket.send_text(payload)
         except Exception as e:
             logger.error(f"Error sending to client: {e}")
             raise
 
-    async def _update_global_metrics(self):
-        """Update global metrics (called periodically)"""
+    async def _update_global_metrics(self, timestamp_iso: Optional[str] = None):
+        """
+        Update global metrics (called periodically)
+
+        Args:
+            timestamp_iso: ISO timestamp of the triggering event (reused instead of
+                taking and formatting a new datetime.now())
+        """
         # This would query the database for current metrics
         # For now, we'll update the timestamp
-        self.current_metrics["last_update"] = datetime.now().isoformat()
+        self.current_metrics["last_update"] = timestamp_iso or datetime.now().isoformat()
 
     def get_connection_count(self) -> int:
         """Get number of active connections"""
@@ -4,11 +4,30 @@ Generates data structures optimized for various chart and visualization types.
 """
 
 import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple, Union
 from loguru import logger
 
+# datetime64 unit each interval's key can be derived from (weeks are keyed per day,
+# since "<year>-W<iso week>" does not line up with numpy's week unit)
+_INTERVAL_UNITS = {
+    "hour": "h",
+    "day": "D",
+    "week": "D",
+    "month": "M"
+}
+
+# Aggregation names understood by pandas groupby
+_PANDAS_AGGREGATIONS = {
+    "mean": "mean",
+    "sum": "sum",
+    "count": "count",
+    "min": "min",
+    "max": "max",
+    "median": "median"
+}
+
 
 class VisualizationData:
     """
@@ -42,37 +61,37 @@ class VisualizationData:
             Heatmap data structure
         """
         try:
-            # Initialize heatmap matrix
-            x_labels = []
-            y_labels = []
-            values = defaultdict(lambda: defaultdict(list))
+            # Collect dimensions and values per record
+            x_values = []
+            y_values = []
+            cell_values = []
 
             # Process data
             for record in data:
-                x_value = self._extract_dimension(record, x_axis)
-                y_value = self._extract_dimension(record, y_axis)
-                val = record.get(value_field, 0)
-
-                if x_value not in x_labels:
-                    x_labels.append(x_value)
-                if y_value not in y_labels:
-                    y_labels.append(y_value)
-
-                values[y_value][x_value].append(val)
-
-            # Sort labels
-            x_labels = sorted(x_labels)
-            y_labels = sorted(y_labels)
-
-            # Calculate averages for each cell
-            matrix = []
-            for y in y_labels:
-                row = []
-                for x in x_labels:
-                    cell_values = values[y][x]
-                    avg = np.mean(cell_values) if cell_values else 0
-                    row.append(round(avg, 2))
-                matrix.append(row)
+                x_values.append(self._extract_dimension(record, x_axis))
+                y_values.append(self._extract_dimension(record, y_axis))
+                cell_values.append(record.get(value_field, 0))
+
+            if cell_values:
+                # Sorted labels and each record's label index in one call per axis
+                x_labels, x_idx = np.unique(np.array(x_values), return_inverse=True)
+                y_labels, y_idx = np.unique(np.array(y_values), return_inverse=True)
+                x_labels = x_labels.tolist()
+                y_labels = y_labels.tolist()
+
+                # Calculate averages for each cell as one grouped sum/count
+                nx, ny = len(x_labels), len(y_labels)
+                flat_idx = y_idx * nx + x_idx
+                sums = np.bincount(
+                    flat_idx, weights=np.asarray(cell_values, dtype=np.float64), minlength=nx * ny
+                )
+                counts = np.bincount(flat_idx, minlength=nx * ny)
+                grid = np.round(sums / np.maximum(counts, 1), 2).reshape(ny, nx)
+            else:
+                x_labels = []
+                y_labels = []
+                grid = np.zeros((0, 0))
+            matrix = grid.tolist()
 
             return {
                 "x_labels": x_labels,
@@ -81,8 +100,8 @@ class VisualizationData:
                 "x_axis": x_axis,
                 "y_axis": y_axis,
                 "value_field": value_field,
-                "min_value": round(float(np.min([v for row in matrix for v in row])), 2) if matrix else 0,
-                "max_value": round(float(np.max([v for row in matrix for v in row])), 2) if matrix else 0,
+                "min_value": round(float(grid.min()), 2) if grid.size else 0,
+                "max_value": round(float(grid.max()), 2) if grid.size else 0,
                 "data_points": len(data)
             }
 
@@ -125,45 +144,48 @@ class VisualizationData:
                         if isinstance(val, (int, float)) and key != time_field:
                             value_fields.append(key)
 
-            # Group data by time interval
-            time_groups = defaultdict(lambda: defaultdict(list))
-
-            for record in data:
-                timestamp = record.get(time_field)
-                if not timestamp:
-                    continue
-
-                # Group by interval
-                time_key = self._get_time_interval_key(timestamp, interval)
-
-                for field in value_fields:
-                    value = record.get(field)
-                    if value is not None:
-                        time_groups[time_key][field].append(value)
-
-            # Sort time keys
-            sorted_times = sorted(time_groups.keys())
+            # Bucket records by time interval
+            records = [record for record in data if record.get(time_field)]
+            time_keys = self._get_time_interval_keys(
+                [record[time_field] for record in records], interval
+            )
 
-            # Aggregate values
-            series_data = defaultdict(list)
             timestamps = []
-
-            for time_key in sorted_times:
-                timestamps.append(time_key)
-                for field in value_fields:
-                    values = time_groups[time_key][field]
-                    if values:
-                        agg_value = self._aggregate(values, aggregation)
-                        series_data[field].append(round(agg_value, 2))
-                    else:
-                        series_data[field].append(None)
+            series_data = {field: [] for field in value_fields}
+
+            if records and value_fields:
+                # Columnarize once: one float64 array per field, missing values as NaN
+                n = len(records)
+                frame = pd.DataFrame({
+                    field: np.fromiter(
+                        (np.nan if (v := record.get(field)) is None else v for record in records),
+                        dtype=np.float64,
+                        count=n
+                    )
+                    for field in value_fields
+                })
+
+                # Aggregate every (bucket, field) in one groupby; NaNs are skipped
+                grouped = frame.groupby(time_keys, sort=True)
+                counts = grouped.count()
+                aggregated = grouped.agg(_PANDAS_AGGREGATIONS.get(aggregation, "mean")).round(2)
+
+                # Buckets only exist if at least one field had a value
+                present = counts.to_numpy() > 0
+                keep = present.any(axis=1)
+                timestamps = aggregated.index[keep].tolist()
+
+                agg_values = aggregated.to_numpy()[keep]
+                present = present[keep]
+                for j, field in enumerate(value_fields):
+                    series_data[field] = [
+                        v if p else None
+                        for v, p in zip(agg_values[:, j].tolist(), present[:, j].tolist())
+                    ]
 
             return {
                 "timestamps": timestamps,
-                "series": {
-                    field: series_data[field]
-                    for field in value_fields
-                },
+                "series": series_data,
                 "interval": interval,
                 "aggregation": aggregation,
                 "data_points": len(data)
@@ -202,21 +224,18 @@ class VisualizationData:
                     "counts": []
                 }
 
+            data_arr = np.asarray(data, dtype=np.float64)
+
             # Calculate histogram
-            counts, bin_edges = np.histogram(data, bins=bins)
+            counts, bin_edges = np.histogram(data_arr, bins=bins)
 
             # Format bin labels
-            bin_labels = []
-            for i in range(len(counts)):
-                label = f"{bin_edges[i]:.1f}-{bin_edges[i+1]:.1f}"
-                bin_labels.append(label)
-
-            # Calculate statistics
-            mean = np.mean(data)
-            median = np.median(data)
-            std = np.std(data)
-            q1 = np.percentile(data, 25)
-            q3 = np.percentile(data, 75)
+            bin_labels = [f"{lo:.1f}-{hi:.1f}" for lo, hi in zip(bin_edges[:-1].tolist(), bin_edges[1:].tolist())]
+
+            # Calculate statistics (order statistics from a single quantile call)
+            minimum, q1, median, q3, maximum = np.quantile(data_arr, [0.0, 0.25, 0.5, 0.75, 1.0]).tolist()
+            mean = float(data_arr.mean())
+            std = float(data_arr.std())
 
             return {
                 "bin_labels": bin_labels,
@@ -226,8 +245,8 @@ class VisualizationData:
                     "mean": round(mean, 2),
                     "median": round(median, 2),
                     "std": round(std, 2),
-                    "min": round(float(np.min(data)), 2),
-                    "max": round(float(np.max(data)), 2),
+                    "min": round(minimum, 2),
+                    "max": round(maximum, 2),
                     "q1": round(q1, 2),
                     "q3": round(q3, 2)
                 },
@@ -272,28 +291,32 @@ class VisualizationData:
                     if isinstance(val, (int, float)):
                         fields.append(key)
 
-            # Extract values for each field
-            field_values = {field: [] for field in fields}
-            for record in data:
-                for field in fields:
-                    value = record.get(field)
-                    if value is not None:
-                        field_values[field].append(value)
-
-            # Calculate correlation matrix
+            # Extract values for each field (missing -> NaN), shape (fields, records)
             n = len(fields)
-            matrix = [[0.0 for _ in range(n)] for _ in range(n)]
-
-            for i, field1 in enumerate(fields):
-                for j, field2 in enumerate(fields):
-                    if i == j:
-                        matrix[i][j] = 1.0
-                    else:
-                        corr = self._calculate_correlation(
-                            field_values[field1],
-                            field_values[field2]
-                        )
-                        matrix[i][j] = round(corr, 3)
+            values = np.array(
+                [[record.get(field) for field in fields] for record in data],
+                dtype=np.float64
+            ).reshape(len(data), n).T
+
+            if not np.isnan(values).any():
+                # No missing values: the whole matrix in one corrcoef call
+                if values.shape[1] < 2:
+                    corr = np.eye(n)
+                else:
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        corr = np.atleast_2d(np.corrcoef(values))
+                    # Constant fields have no defined correlation
+                    corr = np.nan_to_num(corr, nan=0.0)
+                    np.fill_diagonal(corr, 1.0)
+            else:
+                # Pairwise-complete: each pair uses the records that have both
+                # fields, so a gap in one field does not change other pairs
+                corr = np.eye(n)
+                for i in range(n):
+                    for j in range(i + 1, n):
+                        corr[i, j] = corr[j, i] = self._calculate_correlation(values[i], values[j])
+
+            matrix = np.round(corr, 3).tolist()
 
             return {
                 "fields": fields,
@@ -330,24 +353,28 @@ class VisualizationData:
         """
         try:
             # Group data
-            groups = defaultdict(list)
+            group_keys = []
+            group_values = []
             for record in data:
                 group = record.get(group_by)
                 value = record.get(value_field)
                 if group is not None and value is not None:
-                    groups[group].append(value)
-
-            # Aggregate
-            labels = sorted(groups.keys(), key=str)
-            values = []
-
-            for label in labels:
-                group_values = groups[label]
-                agg_value = self._aggregate(group_values, aggregation)
-                values.append(round(agg_value, 2))
+                    group_keys.append(str(group))
+                    group_values.append(value)
+
+            # Aggregate: sorted labels plus each record's group index, then grouped reductions
+            if group_keys:
+                labels, group_idx = np.unique(np.array(group_keys), return_inverse=True)
+                labels = labels.tolist()
+                values = self._aggregate_groups(
+                    group_idx, np.asarray(group_values, dtype=np.float64), len(labels), aggregation
+                )
+            else:
+                labels = []
+                values = []
 
             return {
-                "labels": [str(l) for l in labels],
+                "labels": labels,
                 "values": values,
                 "group_by": group_by,
                 "value_field": value_field,
@@ -449,43 +476,78 @@ class VisualizationData:
         else:
             return str(timestamp)
 
-    def _aggregate(self, values: List[float], aggregation: str) -> float:
-        """Aggregate values using specified method"""
-        if not values:
-            return 0.0
-
-        if aggregation == "mean":
-            return np.mean(values)
-        elif aggregation == "sum":
-            return np.sum(values)
-        elif aggregation == "count":
-            return len(values)
-        elif aggregation == "min":
-            return np.min(values)
-        elif aggregation == "max":
-            return np.max(values)
+    def _get_time_interval_keys(self, timestamps: List[datetime], interval: str) -> np.ndarray:
+        """Get time interval keys for many timestamps, formatting each distinct bucket once"""
+        unit = _INTERVAL_UNITS.get(interval)
+        # datetime64 has no time zones (aware values would be shifted to UTC)
+        if unit is not None and not any(getattr(ts, "tzinfo", None) for ts in timestamps):
+            try:
+                buckets = np.array(timestamps, dtype=f"datetime64[{unit}]")
+            except (TypeError, ValueError):
+                pass
+            else:
+                unique_buckets, inverse = np.unique(buckets, return_inverse=True)
+                labels = np.array(
+                    [self._get_time_interval_key(b, interval) for b in unique_buckets.tolist()],
+                    dtype=object
+                )
+                return labels[inverse]
+
+        return np.array(
+            [self._get_time_interval_key(ts, interval) for ts in timestamps], dtype=object
+        )
+
+    def _aggregate_groups(
+        self,
+        group_idx: np.ndarray,
+        values: np.ndarray,
+        n_groups: int,
+        aggregation: str
+    ) -> List[float]:
+        """Aggregate values per group index (0..n_groups-1), rounded to 2 decimals"""
+        if aggregation == "count":
+            return np.bincount(group_idx, minlength=n_groups).tolist()
+
+        if aggregation in ("min", "max"):
+            result = np.full(n_groups, np.inf if aggregation == "min" else -np.inf)
+            ufunc = np.minimum if aggregation == "min" else np.maximum
+            ufunc.at(result, group_idx, values)
         elif aggregation == "median":
-            return np.median(values)
+            # Split the values into contiguous per-group runs
+            order = np.argsort(group_idx, kind="stable")
+            bounds = np.cumsum(np.bincount(group_idx, minlength=n_groups))[:-1]
+            result = np.array([np.median(g) for g in np.split(values[order], bounds)])
         else:
-            return np.mean(values)  # Default to mean
-
-    def _calculate_correlation(self, x: List[float], y: List[float]) -> float:
-        """Calculate Pearson correlation coefficient"""
-        if len(x) != len(y) or len(x) < 2:
+            result = np.bincount(group_idx, weights=values, minlength=n_groups)
+            if aggregation != "sum":
+                # Default to mean
+                result /= np.bincount(group_idx, minlength=n_groups)
+
+        return np.round(result, 2).tolist()
+
+    def _calculate_correlation(self, x: Union[List[float], np.ndarray], y: Union[List[float], np.ndarray]) -> float:
+        """Calculate Pearson correlation coefficient (None/NaN pairs are skipped)"""
+        # None -> NaN on conversion (float64 arrays pass through uncopied),
+        # so missing values are masked without a Python filter
+        x_arr = np.asarray(x, dtype=np.float64)
+        y_arr = np.asarray(y, dtype=np.float64)
+        if x_arr.shape != y_arr.shape or x_arr.size < 2:
             return 0.0
 
-        # Remove None values
-        pairs = [(xi, yi) for xi, yi in zip(x, y) if xi is not None and yi is not None]
-        if len(pairs) < 2:
-            return 0.0
-
-        x_clean, y_clean = zip(*pairs)
-        x_arr = np.array(x_clean)
-        y_arr = np.array(y_clean)
-
-        # Calculate correlation
-        if np.std(x_arr) == 0 or np.std(y_arr) == 0:
+        mask = ~(np.isnan(x_arr) | np.isnan(y_arr))
+        if not mask.all():
+            if np.count_nonzero(mask) < 2:
+                return 0.0
+            x_arr = x_arr[mask]
+            y_arr = y_arr[mask]
+
+        # Single set of deviation dot products instead of std/std/corrcoef
+        x_dev = x_arr - x_arr.mean()
+        y_dev = y_arr - y_arr.mean()
+        sxx = x_dev @ x_dev
+        syy = y_dev @ y_dev
+        if sxx == 0 or syy == 0:
             return 0.0
 
-        corr = np.corrcoef(x_arr, y_arr)[0, 1]
-        return float(corr) if not np.isnan(corr) else 0.0
+        corr = float((x_dev @ y_dev) / np.sqrt(sxx * syy))
+        return max(-1.0, min(1.0, corr))
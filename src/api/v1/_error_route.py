@@ -0,0 +1,38 @@
+"""
+Error Handling Route
+Converts unexpected endpoint errors into HTTP 500 responses inside the router.
+"""
+
+from typing import Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from loguru import logger
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+
+class ErrorLoggingRoute(APIRoute):
+    """
+    API route that logs unexpected errors and re-raises them as HTTPException(500)
+
+    Replaces the per-endpoint `try/except Exception -> HTTPException(500)`
+    blocks. The conversion happens inside the router (unlike an app-level
+    Exception handler, which runs outside CORSMiddleware), so 500 responses
+    still carry CORS headers and a `detail` the frontend can read.
+    HTTPExceptions (400/404/503) and validation errors pass through unchanged.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.error(f"{request.method} {request.url.path} failed: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+        return route_handler
@@ -0,0 +1,88 @@
+"""
+Forecast Response Cache
+Bounded LRU cache for forecast endpoint responses, keyed by a hash of the input series.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+
+class ForecastCache:
+    """
+    LRU cache of forecast responses
+
+    Dashboards re-submit the same historical series every few seconds; the
+    response for a (series, parameters) pair is computed once and reused.
+    Keys include the current date because responses carry forecast dates.
+    Thread-safe: the forecast endpoints run in the threadpool.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Initialize forecast cache
+
+        Args:
+            maxsize: Maximum number of cached responses
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, endpoint: str, values: np.ndarray, *params: Hashable) -> Tuple:
+        """
+        Build a cache key
+
+        Args:
+            endpoint: Endpoint name (keeps different forecasts apart)
+            values: Input series (already converted to an ndarray)
+            *params: Remaining request parameters
+
+        Returns:
+            Hashable cache key
+        """
+        digest = hashlib.blake2b(values.tobytes(), digest_size=16).digest()
+        return (endpoint, values.dtype.str, digest, date.today().toordinal()) + params
+
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Get a cached response (marks it most recently used)"""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, key: Tuple, response: Dict[str, Any]):
+        """Store a response, evicting the least recently used one if full"""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+forecast_cache = ForecastCache()
@@ -4,20 +4,45 @@ Natural language queries powered by RAG + DeepSeek-R1
 """
 
 from fastapi import APIRouter, HTTPException, status
-from typing import Optional, List
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Optional, List, AsyncIterator, Dict, Any
 from pydantic import BaseModel
+import asyncio
+import hashlib
+import json
 import logging
+import time
+import numpy as np
 
 from llm.ollama_client import OllamaClient, ChatMessage
 from llm.prompt_templates import PromptTemplate
+from llm.semantic_cache import SemanticCache
 from rag.knowledge_base import KnowledgeBase
-
-router = APIRouter(prefix="/api/v1/ai", tags=["ai-query"])
+from api.v1._error_route import ErrorLoggingRoute
+
+router = APIRouter(
+    prefix="/api/v1/ai",
+    tags=["ai-query"],
+    default_response_class=ORJSONResponse,
+    route_class=ErrorLoggingRoute
+)
 logger = logging.getLogger(__name__)
 
+# Static system prompt, shared by every natural language query
+_SYSTEM_MSG = ChatMessage(role="system", content=PromptTemplate.SYSTEM_WORKER_ANALYST)
+
 # Global instances (will be injected during startup)
 ollama_client: Optional[OllamaClient] = None
 knowledge_base: Optional[KnowledgeBase] = None
+semantic_cache: Optional[SemanticCache] = None
+
+# Natural language queries currently being answered, keyed by _query_key()
+_in_flight: Dict[str, asyncio.Task] = {}
+
+# Cached /health snapshot
+_HEALTH_TTL = 2.0
+_health_cache: Dict[str, Any] = {"ts": float("-inf"), "data": None}
+_health_lock = asyncio.Lock()
 
 
 def set_ollama_client(client: OllamaClient):
@@ -32,11 +57,94 @@ def set_knowledge_base(kb: KnowledgeBase):
     knowledge_base = kb
 
 
+def set_semantic_cache(cache: SemanticCache):
+    """Set global semantic response cache instance"""
+    global semantic_cache
+    semantic_cache = cache
+
+
+# Server-Sent Events streaming helpers
+
+def _sse_frame(event: str, data: Any) -> str:
+    """Format one SSE frame (data is JSON-encoded so tokens may contain newlines)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def _sse_events(
+    chunks: AsyncIterator[str],
+    show_reasoning: bool,
+    done_data: Dict[str, Any]
+) -> AsyncIterator[str]:
+    """
+    Convert LLM token chunks to SSE frames
+
+    Tokens inside DeepSeek-R1's <think> block are sent as "reasoning" events
+    (or dropped if show_reasoning is False), the rest as "token" events.
+    A final "done" event carries done_data (plus "truncated": true if the
+    stream ended inside <think>); failures end with an "error" event.
+    """
+    in_think = False
+
+    try:
+        async for chunk in chunks:
+            if not in_think and '<think>' in chunk:
+                before, chunk = chunk.split('<think>', 1)
+                if before:
+                    yield _sse_frame("token", before)
+                in_think = True
+
+            if in_think and '</think>' in chunk:
+                thought, chunk = chunk.split('</think>', 1)
+                if thought and show_reasoning:
+                    yield _sse_frame("reasoning", thought)
+                in_think = False
+
+            if not chunk:
+                continue
+
+            if not in_think:
+                yield _sse_frame("token", chunk)
+            elif show_reasoning:
+                yield _sse_frame("reasoning", chunk)
+
+        if in_think:
+            # Stream ended inside the reasoning block: no answer was produced
+            logger.warning("Streamed LLM response ended inside <think>, answer truncated")
+            done_data = {**done_data, "truncated": True}
+
+        yield _sse_frame("done", done_data)
+
+    except Exception as e:
+        logger.error(f"Streaming response failed: {e}")
+        yield _sse_frame("error", {"detail": str(e)})
+
+
+def _stream_response(
+    chunks: AsyncIterator[str],
+    show_reasoning: bool,
+    done_data: Dict[str, Any]
+) -> StreamingResponse:
+    """Wrap LLM token chunks in a text/event-stream response"""
+    return StreamingResponse(
+        _sse_events(chunks, show_reasoning, done_data),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _cached_chunks(cached: Dict[str, Any]) -> AsyncIterator[str]:
+    """Replay a cached answer as a single chunk stream"""
+    if cached.get('reasoning'):
+        yield f"<think>{cached['reasoning']}</think>"
+    yield cached['answer']
+
+
 # Request/Response Models
 class QueryRequest(BaseModel):
     question: str
     show_reasoning: bool = True
     max_context_items: int = 5
+    stream: bool = False  # Stream tokens as Server-Sent Events
 
 
 class QueryResponse(BaseModel):
@@ -46,21 +154,25 @@ class QueryResponse(BaseModel):
     context_used: dict
     model: str
     duration_ms: Optional[int] = None
+    truncated: bool = False
 
 
 class WorkerAnalysisRequest(BaseModel):
     worker_id: str
     include_recommendations: bool = True
+    stream: bool = False
 
 
 class CompareWorkersRequest(BaseModel):
     worker_ids: List[str]
     criteria: Optional[str] = "overall_productivity"
+    stream: bool = False
 
 
 class ShiftSummaryRequest(BaseModel):
     shift: str  # morning, afternoon, night
     date: Optional[str] = None  # YYYY-MM-DD
+    stream: bool = False
 
 
 # Endpoints
@@ -74,6 +186,11 @@ async def natural_language_query(request: QueryRequest):
     - "พนักงาน W001 ทำงานอย่างไรบ้างวันนี้?"
     - "Who has the highest productivity in the morning shift?"
     - "แนะนำการปรับปรุงสำหรับพนักงานที่มี efficiency ต่ำกว่า 70%"
+
+    With stream=true the answer is sent as Server-Sent Events
+    ("token"/"reasoning" events, then "done" with the context used).
+
+    Identical concurrent (non-streaming) queries share one RAG + LLM run.
     """
     if not ollama_client or not knowledge_base:
         raise HTTPException(
@@ -81,54 +198,133 @@ async def natural_language_query(request: QueryRequest):
             detail="AI services not initialized"
         )
 
-    try:
-        # Get relevant context from knowledge base
-        context = knowledge_base.get_context_for_query(
-            query=request.question,
-            max_results=request.max_context_items
-        )
-
-        # Build prompt with context
-        prompt = PromptTemplate.natural_language_query(
-            question=request.question,
-            context_data=context
+    if request.stream:
+        return await _answer_query(request)
+
+    key = _query_key(request)
+    task = _in_flight.get(key)
+    if task is None:
+        # The pipeline runs in its own task so cancelling the first caller
+        # (e.g. client disconnect) does not cancel it for the others
+        task = asyncio.create_task(_answer_query(request))
+        _in_flight[key] = task
+        task.add_done_callback(lambda t: _finish_in_flight(key, t))
+
+    # shield: a disconnecting caller must not cancel the shared run
+    return await asyncio.shield(task)
+
+
+def _finish_in_flight(key: str, task: asyncio.Task):
+    """Forget a finished in-flight query"""
+    if _in_flight.get(key) is task:
+        del _in_flight[key]
+    if not task.cancelled():
+        task.exception()  # mark retrieved (every caller may have disconnected)
+
+
+def _payload_value(payload: Dict[str, Any], key: str, index_key: str, default: Any = 0) -> Any:
+    """Read a flattened productivity field, falling back to the nested indices of older records"""
+    value = payload.get(key)
+    if value is None:
+        value = payload.get('indices', {}).get(index_key, default)
+    return value
+
+
+def _query_key(request: QueryRequest) -> str:
+    """In-flight deduplication key for a query"""
+    raw = f"{request.show_reasoning}|{request.max_context_items}|{request.question}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+async def _answer_query(request: QueryRequest):
+    """Run the RAG + LLM pipeline for a natural language query"""
+    # Embed the question once (cache lookup + retrieval); model and Qdrant
+    # calls are blocking, so they run off the event loop
+    query_vector = await asyncio.to_thread(knowledge_base.embedder.encode_query, request.question)
+
+    # Answer paraphrases of recent questions from the semantic cache
+    if semantic_cache:
+        cached = await asyncio.to_thread(
+            semantic_cache.lookup,
+            query_vector,
+            request.question,
+            show_reasoning=request.show_reasoning,
+            max_context_items=request.max_context_items
         )
-
-        # Build messages
-        messages = [
-            ChatMessage(
-                role="system",
-                content=PromptTemplate.SYSTEM_WORKER_ANALYST
-            ),
-            ChatMessage(
-                role="user",
-                content=prompt
+        if cached:
+            if request.stream:
+                return _stream_response(
+                    _cached_chunks(cached),
+                    request.show_reasoning,
+                    {"question": request.question, "context_used": cached['context_used'], "model": cached['model']}
+                )
+            return QueryResponse(
+                question=request.question,
+                answer=cached['answer'],
+                reasoning=cached.get('reasoning'),
+                context_used=cached['context_used'],
+                model=cached['model'],
+                duration_ms=0
             )
-        ]
 
-        # Query LLM
-        response = await ollama_client.chat(
-            messages=messages,
-            temperature=0.7,
-            show_reasoning=request.show_reasoning
+    # Get relevant context from knowledge base
+    context = await asyncio.to_thread(
+        knowledge_base.get_context_for_query,
+        query=request.question,
+        max_results=request.max_context_items,
+        query_vector=query_vector
+    )
+
+    # Build prompt with context
+    prompt = PromptTemplate.natural_language_query(
+        question=request.question,
+        context_data=context
+    )
+
+    # Build messages
+    messages = [
+        _SYSTEM_MSG,
+        ChatMessage(
+            role="user",
+            content=prompt
         )
+    ]
 
-        return QueryResponse(
-            question=request.question,
-            answer=response.content,
-            reasoning=response.reasoning,
-            context_used=context,
-            model=response.model or "deepseek-r1:14b",
-            duration_ms=response.total_duration_ms
+    if request.stream:
+        return _stream_response(
+            ollama_client.chat_stream(messages=messages, temperature=0.7),
+            request.show_reasoning,
+            {"question": request.question, "context_used": context, "model": ollama_client.model}
         )
 
-    except Exception as e:
-        logger.error(f"Query failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Query processing failed: {str(e)}"
+    # Query LLM
+    response = await ollama_client.chat(
+        messages=messages,
+        temperature=0.7,
+        show_reasoning=request.show_reasoning
+    )
+
+    result = QueryResponse(
+        question=request.question,
+        answer=response.content,
+        reasoning=response.reasoning,
+        context_used=context,
+        model=response.model or "deepseek-r1:14b",
+        duration_ms=response.total_duration_ms,
+        truncated=response.truncated
+    )
+
+    if semantic_cache and not response.truncated:
+        await asyncio.to_thread(
+            semantic_cache.put,
+            query_vector,
+            show_reasoning=request.show_reasoning,
+            max_context_items=request.max_context_items,
+            response=result.dict(include={'question', 'answer', 'reasoning', 'context_used', 'model'})
         )
 
+    return result
+
 
 @router.post("/analyze/worker")
 async def analyze_worker(request: WorkerAnalysisRequest):
@@ -141,60 +337,66 @@ async def analyze_worker(request: WorkerAnalysisRequest):
             detail="AI services not initialized"
         )
 
-    try:
-        # Search for worker productivity data
-        results = knowledge_base.search_productivity(
-            query=f"worker {request.worker_id} productivity performance",
-            limit=5,
-            worker_id=request.worker_id
-        )
-
-        if not results:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"No productivity data found for worker {request.worker_id}"
-            )
-
-        # Get latest productivity data
-        latest = results[0]['payload']
-        indices = latest.get('indices', {})
+    # Search for worker productivity data (off the event loop)
+    results = await asyncio.to_thread(
+        knowledge_base.search_productivity,
+        query=f"worker {request.worker_id} productivity performance",
+        limit=5,
+        worker_id=request.worker_id
+    )
 
-        # Generate analysis prompt
-        prompt = PromptTemplate.worker_performance_query(
-            worker_name=latest.get('worker_name', request.worker_id),
-            indices=indices,
-            context="Please provide detailed analysis and actionable recommendations." if request.include_recommendations else ""
+    if not results:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No productivity data found for worker {request.worker_id}"
         )
 
-        # Query LLM
-        response = await ollama_client.generate(
-            prompt=prompt,
-            temperature=0.7
+    # Get latest productivity data
+    latest = results[0]['payload']
+    indices = latest.get('indices', {})
+
+    # Generate analysis prompt
+    prompt = PromptTemplate.worker_performance_query(
+        worker_name=latest.get('worker_name', request.worker_id),
+        indices=indices,
+        context="Please provide detailed analysis and actionable recommendations." if request.include_recommendations else ""
+    )
+
+    if request.stream:
+        return _stream_response(
+            ollama_client.generate_stream(prompt=prompt, temperature=0.7),
+            True,
+            {
+                "worker_id": request.worker_id,
+                "worker_name": latest.get('worker_name'),
+                "productivity_data": indices,
+                "model": ollama_client.model
+            }
         )
 
-        return {
-            "worker_id": request.worker_id,
-            "worker_name": latest.get('worker_name'),
-            "analysis": response.content,
-            "reasoning": response.reasoning,
-            "productivity_data": indices,
-            "model": response.model
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Worker analysis failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Analysis failed: {str(e)}"
-        )
+    # Query LLM
+    response = await ollama_client.generate(
+        prompt=prompt,
+        temperature=0.7
+    )
+
+    return {
+        "worker_id": request.worker_id,
+        "worker_name": latest.get('worker_name'),
+        "analysis": response.content,
+        "reasoning": response.reasoning,
+        "truncated": response.truncated,
+        "productivity_data": indices,
+        "model": response.model
+    }
 
 
 @router.post("/compare/workers")
 async def compare_workers(request: CompareWorkersRequest):
     """
     Compare multiple workers' performance
+
+    Sampled at temperature 0.3 (structured comparison).
     """
     if not ollama_client or not knowledge_base:
         raise HTTPException(
@@ -202,62 +404,67 @@ async def compare_workers(request: CompareWorkersRequest):
             detail="AI services not initialized"
         )
 
-    try:
-        # Gather data for all workers
-        workers_data = []
-
-        for worker_id in request.worker_ids:
-            results = knowledge_base.search_productivity(
-                query=f"worker {worker_id} latest productivity",
-                limit=1,
-                worker_id=worker_id
-            )
-
-            if results:
-                payload = results[0]['payload']
-                workers_data.append({
-                    'name': payload.get('worker_name', worker_id),
-                    'worker_id': worker_id,
-                    'indices': payload.get('indices', {})
-                })
-
-        if not workers_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No productivity data found for specified workers"
-            )
-
-        # Generate comparison prompt
-        prompt = PromptTemplate.compare_workers(workers_data)
-
-        # Query LLM
-        response = await ollama_client.generate(
-            prompt=prompt,
-            temperature=0.7
+    # Gather data for all workers (one batched search, off the event loop)
+    results_list = await asyncio.to_thread(
+        knowledge_base.search_productivity_batch,
+        queries=[f"worker {worker_id} latest productivity" for worker_id in request.worker_ids],
+        worker_ids=request.worker_ids,
+        limit=1
+    )
+
+    workers_data = []
+
+    for worker_id, results in zip(request.worker_ids, results_list):
+        if results:
+            payload = results[0]['payload']
+            workers_data.append({
+                'name': payload.get('worker_name', worker_id),
+                'worker_id': worker_id,
+                'indices': payload.get('indices', {})
+            })
+
+    if not workers_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No productivity data found for specified workers"
         )
 
-        return {
-            "workers_compared": len(workers_data),
-            "comparison": response.content,
-            "reasoning": response.reasoning,
-            "workers_data": workers_data,
-            "model": response.model
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Worker comparison failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Comparison failed: {str(e)}"
+    # Generate comparison prompt
+    prompt = PromptTemplate.compare_workers(workers_data)
+
+    if request.stream:
+        return _stream_response(
+            ollama_client.generate_stream(prompt=prompt, temperature=0.3),
+            True,
+            {
+                "workers_compared": len(workers_data),
+                "workers_data": workers_data,
+                "model": ollama_client.model
+            }
         )
 
+    # Query LLM
+    response = await ollama_client.generate(
+        prompt=prompt,
+        temperature=0.3
+    )
+
+    return {
+        "workers_compared": len(workers_data),
+        "comparison": response.content,
+        "reasoning": response.reasoning,
+        "truncated": response.truncated,
+        "workers_data": workers_data,
+        "model": response.model
+    }
+
 
 @router.post("/summary/shift")
 async def shift_summary(request: ShiftSummaryRequest):
     """
     Generate shift performance summary
+
+    Sampled at temperature 0.2 (fixed-structure summary).
     """
     if not ollama_client or not knowledge_base:
         raise HTTPException(
@@ -265,84 +472,124 @@ async def shift_summary(request: ShiftSummaryRequest):
             detail="AI services not initialized"
         )
 
-    try:
-        # Search for shift data
-        query = f"{request.shift} shift productivity performance"
-        if request.date:
-            query += f" on {request.date}"
-
-        results = knowledge_base.search_productivity(
-            query=query,
-            limit=20
-        )
+    # Make sure the model is loaded while retrieval and statistics run
+    warm_task = asyncio.create_task(ollama_client.warm_model())
 
-        if not results:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"No data found for {request.shift} shift"
-            )
+    # Search for shift data (off the event loop, so the warm-up request proceeds)
+    query = f"{request.shift} shift productivity performance"
+    if request.date:
+        query += f" on {request.date}"
 
-        # Calculate shift statistics
-        total_workers = len(set(r['payload'].get('worker_id') for r in results))
-        productivities = [r['payload'].get('overall_productivity', 0) for r in results]
-        avg_productivity = sum(productivities) / len(productivities) if productivities else 0
+    results = await asyncio.to_thread(
+        knowledge_base.search_productivity,
+        query=query,
+        limit=20
+    )
 
-        total_output = sum(
-            r['payload'].get('indices', {}).get('index_8_tasks_completed', 0)
-            for r in results
+    if not results:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No data found for {request.shift} shift"
         )
 
-        # Detect issues
-        issues = []
-        for r in results:
-            indices = r['payload'].get('indices', {})
-            if indices.get('index_11_overall_productivity', 0) < 60:
-                issues.append(
-                    f"Low productivity: {r['payload'].get('worker_name')} ({indices.get('index_11_overall_productivity', 0):.1f}/100)"
-                )
-
-        # Generate summary prompt
-        prompt = PromptTemplate.shift_summary(
-            shift_name=request.shift,
-            total_workers=total_workers,
-            avg_productivity=avg_productivity,
-            total_output=total_output,
-            issues=issues[:5] if issues else None
-        )
+    # Calculate shift statistics (one pass over payloads, reductions in NumPy)
+    # overall_productivity is indices.index_11_overall_productivity, flattened at ingest
+    payloads = [r['payload'] for r in results]
+    n = len(payloads)
+
+    total_workers = len(dict.fromkeys(p.get('worker_id') for p in payloads))
+    productivities = np.fromiter(
+        (p.get('overall_productivity', 0) for p in payloads), dtype=np.float64, count=n
+    )
+    outputs = np.fromiter(
+        (_payload_value(p, 'tasks_completed', 'index_8_tasks_completed') for p in payloads),
+        dtype=np.int64, count=n
+    )
+
+    avg_productivity = float(productivities.mean())
+    total_output = int(outputs.sum())
+
+    # Detect issues (only the first few are formatted for the prompt)
+    low_idx = np.flatnonzero(productivities < 60)
+    issues_count = int(low_idx.size)
+    issues = [
+        f"Low productivity: {payloads[i].get('worker_name')} ({productivities[i]:.1f}/100)"
+        for i in low_idx[:5]
+    ]
+
+    # Generate summary prompt
+    prompt = PromptTemplate.shift_summary(
+        shift_name=request.shift,
+        total_workers=total_workers,
+        avg_productivity=avg_productivity,
+        total_output=total_output,
+        issues=issues or None
+    )
+
+    statistics = {
+        "total_workers": total_workers,
+        "avg_productivity": avg_productivity,
+        "total_output": total_output,
+        "issues_count": issues_count
+    }
 
-        # Query LLM
-        response = await ollama_client.generate(
-            prompt=prompt,
-            temperature=0.7
+    # Warm-up normally finished during retrieval; this only orders the calls
+    await warm_task
+
+    if request.stream:
+        return _stream_response(
+            ollama_client.generate_stream(prompt=prompt, temperature=0.2),
+            True,
+            {
+                "shift": request.shift,
+                "date": request.date,
+                "statistics": statistics,
+                "model": ollama_client.model
+            }
         )
 
-        return {
-            "shift": request.shift,
-            "date": request.date,
-            "summary": response.content,
-            "reasoning": response.reasoning,
-            "statistics": {
-                "total_workers": total_workers,
-                "avg_productivity": avg_productivity,
-                "total_output": total_output,
-                "issues_count": len(issues)
-            },
-            "model": response.model
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Shift summary failed: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Summary generation failed: {str(e)}"
-        )
+    # Query LLM
+    response = await ollama_client.generate(
+        prompt=prompt,
+        temperature=0.2
+    )
+
+    return {
+        "shift": request.shift,
+        "date": request.date,
+        "summary": response.content,
+        "reasoning": response.reasoning,
+        "truncated": response.truncated,
+        "statistics": statistics,
+        "model": response.model
+    }
 
 
 @router.get("/health")
 async def ai_health_check():
-    """Check AI services health"""
+    """
+    Check AI services health
+
+    The snapshot (which probes Ollama over HTTP) is cached for _HEALTH_TTL
+    seconds so frequent liveness probes do not each hit Ollama.
+    """
+    if time.monotonic() - _health_cache["ts"] < _HEALTH_TTL:
+        return _health_cache["data"]
+
+    async with _health_lock:
+        # Another probe may have refreshed the snapshot while we waited
+        if time.monotonic() - _health_cache["ts"] < _HEALTH_TTL:
+            return _health_cache["data"]
+
+        health = await _collect_health()
+        _health_cache["data"] = health
+        _health_cache["ts"] = time.monotonic()
+
+    return health
+
+
+async def _collect_health() -> Dict[str, Any]:
+    """Build a fresh AI services health snapshot"""
     health = {
         "ollama_client": {
             "initialized": ollama_client is not None,
@@ -350,6 +597,9 @@ async def ai_health_check():
         },
         "knowledge_base": {
             "initialized": knowledge_base is not None
+        },
+        "semantic_cache": {
+            "initialized": semantic_cache is not None
         }
     }
 
@@ -361,6 +611,9 @@ async def ai_health_check():
     if knowledge_base:
         health["knowledge_base"]["stats"] = knowledge_base.get_stats()
 
+    if semantic_cache:
+        health["semantic_cache"]["stats"] = semantic_cache.get_stats()
+
     return health
 
 
@@ -373,15 +626,8 @@ async def list_models():
             detail="Ollama client not initialized"
         )
 
-    try:
-        models = await ollama_client.list_models()
-        return {
-            "models": models,
-            "current_model": ollama_client.model
-        }
-    except Exception as e:
-        logger.error(f"Failed to list models: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list models: {str(e)}"
-        )
+    models = await ollama_client.list_models()
+    return {
+        "models": models,
+        "current_model": ollama_client.model
+    }
@@ -4,18 +4,31 @@ Advanced analytics queries and data retrieval.
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Any, Awaitable, Callable
 from datetime import datetime, timedelta
-from loguru import logger
+import numpy as np
 
 from analytics.realtime_analytics import RealtimeAnalytics, EventType
-from analytics.predictive_analytics import PredictiveAnalytics
+from analytics.predictive_analytics import PredictiveAnalytics, forecast_date_strings
 from analytics.visualization_data import VisualizationData
 from analytics.benchmarking import Benchmarking
 from analytics.export_manager import ExportManager
+from analytics.forecast_pool import get_forecast_pool
+from api.v1._error_route import ErrorLoggingRoute
+from api.v1._forecast_cache import forecast_cache
 
-router = APIRouter(prefix="/api/v1/analytics", tags=["analytics"])
+router = APIRouter(
+    prefix="/api/v1/analytics",
+    tags=["analytics"],
+    default_response_class=ORJSONResponse,
+    route_class=ErrorLoggingRoute
+)
+
+# Event type validation (membership test instead of EventType() + ValueError)
+_EVENT_VALUES = frozenset(e.value for e in EventType)
+_INVALID_EVENT_DETAIL = f"Invalid event type. Valid types: {[e.value for e in EventType]}"
 
 # Global instances (will be injected)
 realtime_analytics: Optional[RealtimeAnalytics] = None
@@ -35,6 +48,7 @@ def set_predictive_analytics(analytics: PredictiveAnalytics):
     """Inject predictive analytics instance"""
     global predictive_analytics
     predictive_analytics = analytics
+    forecast_cache.clear()
 
 
 def set_visualization_data(viz_data: VisualizationData):
@@ -87,9 +101,56 @@ class EventHistoryResponse(BaseModel):
     events: List[Dict[str, Any]]
 
 
+# Predictive request bodies (JSON body: one parse pass instead of per-value query params)
+class ProductivityForecastRequest(BaseModel):
+    """Productivity forecast request"""
+    model_config = ConfigDict(extra="forbid")
+
+    historical_data: List[float] = Field(..., min_length=1, description="Historical productivity values (time-ordered)")
+    forecast_days: int = Field(7, ge=1, le=30, description="Days to forecast")
+
+
+class OutputForecastRequest(BaseModel):
+    """Output forecast request"""
+    model_config = ConfigDict(extra="forbid")
+
+    historical_output: List[int] = Field(..., min_length=1, description="Historical output values")
+    forecast_days: int = Field(7, ge=1, le=30, description="Days to forecast")
+
+
+class TrendAnalysisRequest(BaseModel):
+    """Trend analysis request"""
+    model_config = ConfigDict(extra="forbid")
+
+    time_series_data: List[float] = Field(..., min_length=1, description="Time-series data")
+    data_type: str = Field("productivity", description="Type of data")
+
+
+class AnomalyPredictionRequest(BaseModel):
+    """Anomaly prediction request"""
+    model_config = ConfigDict(extra="forbid")
+
+    current_value: float = Field(..., description="Current value to check")
+    historical_data: List[float] = Field(..., min_length=1, description="Historical data")
+    threshold_std: float = Field(2.0, description="Standard deviation threshold")
+
+
+class WorkerPerformanceRequest(BaseModel):
+    """Worker performance prediction request"""
+    model_config = ConfigDict(extra="forbid")
+
+    worker_id: str = Field(..., description="Worker ID")
+    worker_history: List[Dict[str, Any]] = Field(..., min_length=1, description="Worker history")
+    forecast_days: int = Field(7, ge=1, le=30, description="Days to forecast")
+
+
 # Endpoints
 
-@router.get("/metrics", response_model=MetricsSnapshot)
+# /metrics and /stats send the producer's dicts as-is (no response_model
+# validation or jsonable_encoder pass); the models stay in the OpenAPI
+# schema via `responses`
+
+@router.get("/metrics", response_model=None, responses={200: {"model": MetricsSnapshot}})
 async def get_current_metrics():
     """
     Get current real-time metrics snapshot
@@ -100,15 +161,10 @@ async def get_current_metrics():
     if not realtime_analytics:
         raise HTTPException(status_code=503, detail="Real-time analytics not initialized")
 
-    try:
-        metrics = await realtime_analytics.get_metrics_snapshot()
-        return MetricsSnapshot(**metrics)
-    except Exception as e:
-        logger.error(f"Error getting metrics: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return ORJSONResponse(await realtime_analytics.get_metrics_snapshot())
 
 
-@router.get("/stats", response_model=AnalyticsStats)
+@router.get("/stats", response_model=None, responses={200: {"model": AnalyticsStats}})
 async def get_analytics_stats():
     """
     Get analytics system statistics
@@ -119,12 +175,7 @@ async def get_analytics_stats():
     if not realtime_analytics:
         raise HTTPException(status_code=503, detail="Real-time analytics not initialized")
 
-    try:
-        stats = realtime_analytics.get_stats()
-        return AnalyticsStats(**stats)
-    except Exception as e:
-        logger.error(f"Error getting stats: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return ORJSONResponse(realtime_analytics.get_stats())
 
 
 @router.get("/history", response_model=EventHistoryResponse)
@@ -145,32 +196,23 @@ async def get_event_history(
     if not realtime_analytics:
         raise HTTPException(status_code=503, detail="Real-time analytics not initialized")
 
-    try:
-        # Validate event type
-        event_type_enum = None
-        if event_type:
-            try:
-                event_type_enum = EventType(event_type)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid event type. Valid types: {[e.value for e in EventType]}"
-                )
-
-        events = await realtime_analytics.get_event_history(
-            event_type=event_type_enum,
-            limit=limit
-        )
-
-        return EventHistoryResponse(
-            total_events=len(events),
-            events=events
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting event history: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Validate event type
+    event_type_enum = None
+    if event_type:
+        if event_type not in _EVENT_VALUES:
+            raise HTTPException(status_code=400, detail=_INVALID_EVENT_DETAIL)
+        event_type_enum = EventType(event_type)
+
+    events = await realtime_analytics.get_event_history(
+        event_type=event_type_enum,
+        limit=limit
+    )
+
+    # Events are plain JSON dicts already; skip re-validating up to 500 of them
+    return ORJSONResponse({
+        "total_events": len(events),
+        "events": events
+    })
 
 
 @router.get("/connections")
@@ -184,18 +226,63 @@ async def get_connection_info():
     if not realtime_analytics:
         raise HTTPException(status_code=503, detail="Real-time analytics not initialized")
 
-    try:
-        return {
-            "active_connections": realtime_analytics.get_connection_count(),
-            "is_running": realtime_analytics.is_running,
-            "websocket_endpoints": [
-                "/ws/analytics",
-                "/ws/live-metrics"
-            ]
-        }
-    except Exception as e:
-        logger.error(f"Error getting connection info: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "active_connections": realtime_analytics.get_connection_count(),
+        "is_running": realtime_analytics.is_running,
+        "websocket_endpoints": [
+            "/ws/analytics",
+            "/ws/live-metrics"
+        ]
+    }
+
+
+async def _emit_test_worker_status(analytics: RealtimeAnalytics, message: str):
+    await analytics.update_worker_status(
+        worker_id="TEST001",
+        worker_name="Test Worker",
+        status="active",
+        current_zone="Test Zone",
+        productivity=85.5
+    )
+
+
+async def _emit_test_productivity_update(analytics: RealtimeAnalytics, message: str):
+    await analytics.update_productivity(
+        worker_id="TEST001",
+        worker_name="Test Worker",
+        indices={
+            "index_11_overall_productivity": 85.5,
+            "index_5_work_efficiency": 78.2
+        },
+        shift="morning"
+    )
+
+
+async def _emit_test_alert(analytics: RealtimeAnalytics, message: str):
+    await analytics.publish_alert(
+        alert_type="test_alert",
+        message=message,
+        severity="warning",
+        worker_id="TEST001",
+        worker_name="Test Worker"
+    )
+
+
+async def _emit_test_system_status(analytics: RealtimeAnalytics, message: str):
+    await analytics.publish_system_status({
+        "status": "healthy",
+        "message": message,
+        "timestamp": datetime.now().isoformat()
+    })
+
+
+# Test event publishers by event type value
+_TEST_EVENT_DISPATCH: Dict[str, Callable[[RealtimeAnalytics, str], Awaitable[None]]] = {
+    EventType.WORKER_STATUS.value: _emit_test_worker_status,
+    EventType.PRODUCTIVITY_UPDATE.value: _emit_test_productivity_update,
+    EventType.ALERT.value: _emit_test_alert,
+    EventType.SYSTEM_STATUS.value: _emit_test_system_status
+}
 
 
 @router.post("/test-event")
@@ -216,81 +303,61 @@ async def test_event(
     if not realtime_analytics:
         raise HTTPException(status_code=503, detail="Real-time analytics not initialized")
 
-    try:
-        # Validate event type
-        try:
-            EventType(event_type)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid event type. Valid types: {[e.value for e in EventType]}"
-            )
-
-        # Publish test event based on type
-        if event_type == "worker_status":
-            await realtime_analytics.update_worker_status(
-                worker_id="TEST001",
-                worker_name="Test Worker",
-                status="active",
-                current_zone="Test Zone",
-                productivity=85.5
-            )
-        elif event_type == "productivity_update":
-            await realtime_analytics.update_productivity(
-                worker_id="TEST001",
-                worker_name="Test Worker",
-                indices={
-                    "index_11_overall_productivity": 85.5,
-                    "index_5_work_efficiency": 78.2
-                },
-                shift="morning"
-            )
-        elif event_type == "alert":
-            await realtime_analytics.publish_alert(
-                alert_type="test_alert",
-                message=message,
-                severity="warning",
-                worker_id="TEST001",
-                worker_name="Test Worker"
-            )
-        elif event_type == "system_status":
-            await realtime_analytics.publish_system_status({
-                "status": "healthy",
-                "message": message,
-                "timestamp": datetime.now().isoformat()
-            })
-        else:
-            raise HTTPException(status_code=400, detail="Event type not supported for testing")
-
-        return {
-            "success": True,
-            "event_type": event_type,
-            "message": "Test event published successfully",
-            "active_connections": realtime_analytics.get_connection_count()
-        }
+    # Validate event type
+    if event_type not in _EVENT_VALUES:
+        raise HTTPException(status_code=400, detail=_INVALID_EVENT_DETAIL)
+
+    # Publish test event based on type
+    emit = _TEST_EVENT_DISPATCH.get(event_type)
+    if emit is None:
+        raise HTTPException(status_code=400, detail="Event type not supported for testing")
+    await emit(realtime_analytics, message)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error publishing test event: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "success": True,
+        "event_type": event_type,
+        "message": "Test event published successfully",
+        "active_connections": realtime_analytics.get_connection_count()
+    }
 
 
 # ============================================================================
 # Predictive Analytics Endpoints
 # ============================================================================
 
+# These handlers only do synchronous CPU work, so they are plain `def`:
+# FastAPI runs them in its threadpool instead of on the event loop.
+# Large inputs are fitted in the forecast process pool to get past the GIL.
+
+# Below this many points pickling to a worker process costs more than the fit
+_PROCESS_POOL_MIN_POINTS = 2000
+
+
+def _run_forecast(fn: Callable[..., Any], n_points: int, **kwargs) -> Any:
+    """
+    Run a predictive analytics call, in the process pool for large inputs
+
+    Args:
+        fn: Bound PredictiveAnalytics method (the instance is picklable)
+        n_points: Input size, used to decide whether offloading pays off
+        **kwargs: Arguments for fn
+
+    Returns:
+        fn's result
+    """
+    if n_points >= _PROCESS_POOL_MIN_POINTS:
+        # Blocks only this threadpool thread; the fit runs in another process
+        return get_forecast_pool().submit(fn, **kwargs).result()
+    return fn(**kwargs)
+
+
 @router.post("/predict/productivity")
-async def predict_productivity(
-    historical_data: List[float] = Query(..., description="Historical productivity values"),
-    forecast_days: int = Query(7, ge=1, le=30, description="Days to forecast")
-):
+def predict_productivity(request: ProductivityForecastRequest):
     """
     Forecast future productivity values
 
     Args:
-        historical_data: List of historical productivity values (time-ordered)
-        forecast_days: Number of days to forecast (1-30)
+        request: Forecast request (historical_data time-ordered, forecast_days 1-30)
 
     Returns:
         Productivity forecast with confidence intervals
@@ -298,45 +365,50 @@ async def predict_productivity(
     if not predictive_analytics:
         raise HTTPException(status_code=503, detail="Predictive analytics not initialized")
 
-    try:
-        forecasts = predictive_analytics.forecast_productivity(
-            historical_data=historical_data,
-            forecast_days=forecast_days
-        )
-
-        return {
-            "forecast_days": forecast_days,
-            "forecasts": [
-                {
-                    "day": i + 1,
-                    "date": f.forecast_date.strftime("%Y-%m-%d") if f.forecast_date else None,
-                    "predicted_value": round(f.predicted_value, 2),
-                    "confidence_lower": round(f.confidence_lower, 2),
-                    "confidence_upper": round(f.confidence_upper, 2),
-                    "model": f.model_type
-                }
-                for i, f in enumerate(forecasts)
-            ],
-            "historical_mean": round(sum(historical_data) / len(historical_data), 2),
-            "data_points": len(historical_data)
-        }
+    # Convert once; the ndarray is passed through to the forecaster
+    values = np.asarray(request.historical_data, dtype=np.float64)
+
+    cache_key = forecast_cache.make_key("productivity", values, request.forecast_days)
+    cached = forecast_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    forecasts = _run_forecast(
+        predictive_analytics.forecast_productivity,
+        values.size,
+        historical_data=values,
+        forecast_days=request.forecast_days
+    )
+
+    dates = forecast_date_strings(request.forecast_days)
+    result = {
+        "forecast_days": request.forecast_days,
+        "forecasts": [
+            {
+                "day": i + 1,
+                "date": d,
+                "predicted_value": p,
+                "confidence_lower": lo,
+                "confidence_upper": hi,
+                "model": forecasts.model_type
+            }
+            for i, (d, p, lo, hi) in enumerate(zip(dates, *forecasts.rounded(2)))
+        ],
+        "historical_mean": round(float(values.mean()), 2),
+        "data_points": values.size
+    }
 
-    except Exception as e:
-        logger.error(f"Error predicting productivity: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    forecast_cache.put(cache_key, result)
+    return result
 
 
 @router.post("/predict/output")
-async def predict_output(
-    historical_output: List[int] = Query(..., description="Historical output values"),
-    forecast_days: int = Query(7, ge=1, le=30, description="Days to forecast")
-):
+def predict_output(request: OutputForecastRequest):
     """
     Forecast future output values
 
     Args:
-        historical_output: List of historical output values (units produced)
-        forecast_days: Number of days to forecast (1-30)
+        request: Forecast request (historical_output in units produced, forecast_days 1-30)
 
     Returns:
         Output forecast with confidence intervals
@@ -344,46 +416,53 @@ async def predict_output(
     if not predictive_analytics:
         raise HTTPException(status_code=503, detail="Predictive analytics not initialized")
 
-    try:
-        forecasts = predictive_analytics.forecast_output(
-            historical_output=historical_output,
-            forecast_days=forecast_days
-        )
-
-        return {
-            "forecast_days": forecast_days,
-            "forecasts": [
-                {
-                    "day": i + 1,
-                    "date": f.forecast_date.strftime("%Y-%m-%d") if f.forecast_date else None,
-                    "predicted_value": int(f.predicted_value),
-                    "confidence_lower": int(f.confidence_lower),
-                    "confidence_upper": int(f.confidence_upper),
-                    "model": f.model_type
-                }
-                for i, f in enumerate(forecasts)
-            ],
-            "historical_mean": round(sum(historical_output) / len(historical_output), 2),
-            "total_historical_output": sum(historical_output),
-            "data_points": len(historical_output)
-        }
+    # Convert once; the ndarray is passed through to the forecaster
+    values = np.asarray(request.historical_output, dtype=np.int64)
+
+    cache_key = forecast_cache.make_key("output", values, request.forecast_days)
+    cached = forecast_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    total_output = int(values.sum())
+
+    forecasts = _run_forecast(
+        predictive_analytics.forecast_output,
+        values.size,
+        historical_output=values,
+        forecast_days=request.forecast_days
+    )
+
+    dates = forecast_date_strings(request.forecast_days)
+    result = {
+        "forecast_days": request.forecast_days,
+        "forecasts": [
+            {
+                "day": i + 1,
+                "date": d,
+                "predicted_value": p,
+                "confidence_lower": lo,
+                "confidence_upper": hi,
+                "model": forecasts.model_type
+            }
+            for i, (d, p, lo, hi) in enumerate(zip(dates, *forecasts.truncated()))
+        ],
+        "historical_mean": round(total_output / values.size, 2),
+        "total_historical_output": total_output,
+        "data_points": values.size
+    }
 
-    except Exception as e:
-        logger.error(f"Error predicting output: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    forecast_cache.put(cache_key, result)
+    return result
 
 
 @router.post("/analyze/trend")
-async def analyze_trend(
-    time_series_data: List[float] = Query(..., description="Time-series data"),
-    data_type: str = Query("productivity", description="Type of data")
-):
+def analyze_trend(request: TrendAnalysisRequest):
     """
     Analyze trend in time-series data
 
     Args:
-        time_series_data: Time-ordered data points
-        data_type: Type of data (productivity, output, efficiency)
+        request: Trend request (time-ordered time_series_data; data_type: productivity, output, efficiency)
 
     Returns:
         Trend analysis with predictions
@@ -391,44 +470,45 @@ async def analyze_trend(
     if not predictive_analytics:
         raise HTTPException(status_code=503, detail="Predictive analytics not initialized")
 
-    try:
-        trend_analysis = predictive_analytics.analyze_trend(
-            time_series_data=time_series_data,
-            data_type=data_type
-        )
-
-        return {
-            "data_type": data_type,
-            "trend": trend_analysis.trend,
-            "slope": round(trend_analysis.slope, 4),
-            "r_squared": round(trend_analysis.r_squared, 4),
-            "prediction_7days": round(trend_analysis.prediction_7days, 2),
-            "prediction_30days": round(trend_analysis.prediction_30days, 2),
-            "data_points": len(time_series_data),
-            "interpretation": {
-                "trend_strength": "strong" if trend_analysis.r_squared > 0.7 else "moderate" if trend_analysis.r_squared > 0.4 else "weak",
-                "trend_description": f"The {data_type} is {trend_analysis.trend} with a {'strong' if trend_analysis.r_squared > 0.7 else 'moderate' if trend_analysis.r_squared > 0.4 else 'weak'} trend."
-            }
+    values = np.asarray(request.time_series_data, dtype=np.float64)
+
+    cache_key = forecast_cache.make_key("trend", values, request.data_type)
+    cached = forecast_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    trend_analysis = _run_forecast(
+        predictive_analytics.analyze_trend,
+        values.size,
+        time_series_data=values,
+        data_type=request.data_type
+    )
+
+    result = {
+        "data_type": request.data_type,
+        "trend": trend_analysis.trend,
+        "slope": round(trend_analysis.slope, 4),
+        "r_squared": round(trend_analysis.r_squared, 4),
+        "prediction_7days": round(trend_analysis.prediction_7days, 2),
+        "prediction_30days": round(trend_analysis.prediction_30days, 2),
+        "data_points": values.size,
+        "interpretation": {
+            "trend_strength": "strong" if trend_analysis.r_squared > 0.7 else "moderate" if trend_analysis.r_squared > 0.4 else "weak",
+            "trend_description": f"The {request.data_type} is {trend_analysis.trend} with a {'strong' if trend_analysis.r_squared > 0.7 else 'moderate' if trend_analysis.r_squared > 0.4 else 'weak'} trend."
         }
+    }
 
-    except Exception as e:
-        logger.error(f"Error analyzing trend: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    forecast_cache.put(cache_key, result)
+    return result
 
 
 @router.post("/predict/anomaly")
-async def predict_anomaly(
-    current_value: float = Query(..., description="Current value to check"),
-    historical_data: List[float] = Query(..., description="Historical data"),
-    threshold_std: float = Query(2.0, description="Standard deviation threshold")
-):
+def predict_anomaly(request: AnomalyPredictionRequest):
     """
     Predict anomaly probability
 
     Args:
-        current_value: Current value to check
-        historical_data: Historical values for comparison
-        threshold_std: Standard deviation threshold (default 2.0)
+        request: Anomaly request (current_value, historical_data, threshold_std default 2.0)
 
     Returns:
         Anomaly prediction with probability and details
@@ -436,37 +516,38 @@ async def predict_anomaly(
     if not predictive_analytics:
         raise HTTPException(status_code=503, detail="Predictive analytics not initialized")
 
-    try:
-        prediction = predictive_analytics.predict_anomaly_probability(
-            current_value=current_value,
-            historical_data=historical_data,
-            threshold_std=threshold_std
-        )
-
-        return {
-            "current_value": current_value,
-            "threshold_std": threshold_std,
-            **prediction
-        }
+    values = np.asarray(request.historical_data, dtype=np.float64)
+
+    cache_key = forecast_cache.make_key("anomaly", values, request.current_value, request.threshold_std)
+    cached = forecast_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    prediction = _run_forecast(
+        predictive_analytics.predict_anomaly_probability,
+        values.size,
+        current_value=request.current_value,
+        historical_data=values,
+        threshold_std=request.threshold_std
+    )
+
+    result = {
+        "current_value": request.current_value,
+        "threshold_std": request.threshold_std,
+        **prediction
+    }
 
-    except Exception as e:
-        logger.error(f"Error predicting anomaly: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    forecast_cache.put(cache_key, result)
+    return result
 
 
 @router.post("/predict/worker-performance")
-async def predict_worker_performance(
-    worker_id: str = Query(..., description="Worker ID"),
-    worker_history: List[Dict[str, Any]] = Query(..., description="Worker history"),
-    forecast_days: int = Query(7, ge=1, le=30, description="Days to forecast")
-):
+def predict_worker_performance(request: WorkerPerformanceRequest):
     """
     Predict worker performance for upcoming days
 
     Args:
-        worker_id: Worker ID
-        worker_history: List of historical productivity records
-        forecast_days: Number of days to forecast
+        request: Prediction request (worker_id, worker_history records, forecast_days)
 
     Returns:
         Comprehensive performance prediction
@@ -474,27 +555,22 @@ async def predict_worker_performance(
     if not predictive_analytics:
         raise HTTPException(status_code=503, detail="Predictive analytics not initialized")
 
-    try:
-        prediction = predictive_analytics.predict_worker_performance(
-            worker_history=worker_history,
-            forecast_days=forecast_days
-        )
-
-        if "error" in prediction:
-            raise HTTPException(status_code=400, detail=prediction["error"])
+    prediction = _run_forecast(
+        predictive_analytics.predict_worker_performance,
+        len(request.worker_history),
+        worker_history=request.worker_history,
+        forecast_days=request.forecast_days
+    )
 
-        return {
-            "worker_id": worker_id,
-            "forecast_days": forecast_days,
-            "data_points": len(worker_history),
-            **prediction
-        }
+    if "error" in prediction:
+        raise HTTPException(status_code=400, detail=prediction["error"])
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error predicting worker performance: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "worker_id": request.worker_id,
+        "forecast_days": request.forecast_days,
+        "data_points": len(request.worker_history),
+        **prediction
+    }
 
 
 # ============================================================================
@@ -523,19 +599,14 @@ async def generate_heatmap(
     if not visualization_data:
         raise HTTPException(status_code=503, detail="Visualization data not initialized")
 
-    try:
-        heatmap = visualization_data.generate_productivity_heatmap(
-            data=data,
-            x_axis=x_axis,
-            y_axis=y_axis,
-            value_field=value_field
-        )
-
-        return heatmap
+    heatmap = visualization_data.generate_productivity_heatmap(
+        data=data,
+        x_axis=x_axis,
+        y_axis=y_axis,
+        value_field=value_field
+    )
 
-    except Exception as e:
-        logger.error(f"Error generating heatmap: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return heatmap
 
 
 @router.post("/visualize/time-series")
@@ -562,20 +633,15 @@ async def generate_time_series(
     if not visualization_data:
         raise HTTPException(status_code=503, detail="Visualization data not initialized")
 
-    try:
-        chart = visualization_data.generate_time_series_chart(
-            data=data,
-            time_field=time_field,
-            value_fields=value_fields,
-            aggregation=aggregation,
-            interval=interval
-        )
+    chart = visualization_data.generate_time_series_chart(
+        data=data,
+        time_field=time_field,
+        value_fields=value_fields,
+        aggregation=aggregation,
+        interval=interval
+    )
 
-        return chart
-
-    except Exception as e:
-        logger.error(f"Error generating time-series: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return chart
 
 
 @router.post("/visualize/distribution")
@@ -598,18 +664,13 @@ async def generate_distribution(
     if not visualization_data:
         raise HTTPException(status_code=503, detail="Visualization data not initialized")
 
-    try:
-        distribution = visualization_data.generate_distribution_chart(
-            data=data,
-            bins=bins,
-            value_name=value_name
-        )
-
-        return distribution
+    distribution = visualization_data.generate_distribution_chart(
+        data=data,
+        bins=bins,
+        value_name=value_name
+    )
 
-    except Exception as e:
-        logger.error(f"Error generating distribution: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return distribution
 
 
 @router.post("/visualize/correlation")
@@ -630,17 +691,12 @@ async def generate_correlation(
     if not visualization_data:
         raise HTTPException(status_code=503, detail="Visualization data not initialized")
 
-    try:
-        correlation = visualization_data.generate_correlation_matrix(
-            data=data,
-            fields=fields
-        )
+    correlation = visualization_data.generate_correlation_matrix(
+        data=data,
+        fields=fields
+    )
 
-        return correlation
-
-    except Exception as e:
-        logger.error(f"Error generating correlation matrix: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return correlation
 
 
 @router.post("/visualize/comparison")
@@ -665,19 +721,14 @@ async def generate_comparison(
     if not visualization_data:
         raise HTTPException(status_code=503, detail="Visualization data not initialized")
 
-    try:
-        comparison = visualization_data.generate_comparison_chart(
-            data=data,
-            group_by=group_by,
-            value_field=value_field,
-            aggregation=aggregation
-        )
-
-        return comparison
+    comparison = visualization_data.generate_comparison_chart(
+        data=data,
+        group_by=group_by,
+        value_field=value_field,
+        aggregation=aggregation
+    )
 
-    except Exception as e:
-        logger.error(f"Error generating comparison chart: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return comparison
 
 
 @router.get("/visualize/gauge")
@@ -700,18 +751,13 @@ async def generate_gauge(
     if not visualization_data:
         raise HTTPException(status_code=503, detail="Visualization data not initialized")
 
-    try:
-        gauge = visualization_data.generate_gauge_chart(
-            current_value=current_value,
-            min_value=min_value,
-            max_value=max_value
-        )
+    gauge = visualization_data.generate_gauge_chart(
+        current_value=current_value,
+        min_value=min_value,
+        max_value=max_value
+    )
 
-        return gauge
-
-    except Exception as e:
-        logger.error(f"Error generating gauge chart: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return gauge
 
 
 # ============================================================================
@@ -728,18 +774,14 @@ async def compare_to_benchmark(
     if not benchmarking:
         raise HTTPException(status_code=503, detail="Benchmarking not initialized")
 
-    try:
-        result = benchmarking.compare_to_benchmark(current_value, metric_name, benchmark_value)
-        return {
-            "current_value": result.current_value,
-            "benchmark_value": result.benchmark_value,
-            "difference": result.difference,
-            "difference_percent": result.difference_percent,
-            "performance_level": result.performance_level
-        }
-    except Exception as e:
-        logger.error(f"Error comparing to benchmark: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    result = benchmarking.compare_to_benchmark(current_value, metric_name, benchmark_value)
+    return {
+        "current_value": result.current_value,
+        "benchmark_value": result.benchmark_value,
+        "difference": result.difference,
+        "difference_percent": result.difference_percent,
+        "performance_level": result.performance_level
+    }
 
 
 @router.post("/benchmark/historical")
@@ -752,11 +794,7 @@ async def compare_to_historical(
     if not benchmarking:
         raise HTTPException(status_code=503, detail="Benchmarking not initialized")
 
-    try:
-        return benchmarking.compare_to_historical(current_value, historical_values, comparison_period)
-    except Exception as e:
-        logger.error(f"Error comparing to historical: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return benchmarking.compare_to_historical(current_value, historical_values, comparison_period)
 
 
 # ============================================================================
@@ -769,16 +807,14 @@ async def export_json(data: Dict[str, Any], pretty: bool = Query(True)):
     if not export_manager:
         raise HTTPException(status_code=503, detail="Export manager not initialized")
 
-    try:
-        json_content = export_manager.export_to_json(data, pretty)
-        return export_manager.create_download_response(
-            content=json_content,
-            filename=f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            content_type="application/json"
-        )
-    except Exception as e:
-        logger.error(f"Error exporting JSON: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    json_content = export_manager.export_to_json(data, pretty)
+    now = datetime.now()
+    return export_manager.create_download_response(
+        content=json_content,
+        filename=f"export_{now:%Y%m%d_%H%M%S}.json",
+        content_type="application/json",
+        generated_at=now
+    )
 
 
 @router.post("/export/csv")
@@ -787,13 +823,25 @@ async def export_csv(data: List[Dict[str, Any]], columns: Optional[List[str]] =
     if not export_manager:
         raise HTTPException(status_code=503, detail="Export manager not initialized")
 
-    try:
-        csv_content = export_manager.export_to_csv(data, columns)
-        return export_manager.create_download_response(
-            content=csv_content,
-            filename=f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            content_type="text/csv"
-        )
-    except Exception as e:
-        logger.error(f"Error exporting CSV: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    csv_content = export_manager.export_to_csv(data, columns)
+    now = datetime.now()
+    return export_manager.create_download_response(
+        content=csv_content,
+        filename=f"export_{now:%Y%m%d_%H%M%S}.csv",
+        content_type="text/csv",
+        generated_at=now
+    )
+
+
+@router.post("/export/csv/stream")
+async def export_csv_stream(data: List[Dict[str, Any]], columns: Optional[List[str]] = None):
+    """Export data to CSV, streamed row by row as a file download"""
+    if not export_manager:
+        raise HTTPException(status_code=503, detail="Export manager not initialized")
+
+    filename = f"export_{datetime.now():%Y%m%d_%H%M%S}.csv"
+    return StreamingResponse(
+        export_manager.iter_csv_rows(data, columns),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -5,5 +5,6 @@ Handles DeepSeek-R1 integration via Ollama
 
 from .ollama_client import OllamaClient
 from .prompt_templates import PromptTemplate
+from .semantic_cache import SemanticCache
 
-__all__ = ["OllamaClient", "PromptTemplate"]
+__all__ = ["OllamaClient", "PromptTemplate", "SemanticCache"]
@@ -3,18 +3,19 @@ Ollama Client
 Interfaces with local Ollama instance running DeepSeek-R1
 """
 
+import asyncio
 import logging
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 import httpx
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChatMessage:
-    """Chat message structure"""
+    """Chat message structure (immutable, so static messages can be shared)"""
     role: str  # 'system', 'user', 'assistant'
     content: str
 
@@ -28,6 +29,7 @@ class LLMResponse:
     total_duration_ms: Optional[int] = None
     prompt_tokens: Optional[int] = None
     completion_tokens: Optional[int] = None
+    truncated: bool = False  # Generation stopped early (token limit or unclosed <think>)
 
 
 class OllamaClient:
@@ -45,7 +47,8 @@ class OllamaClient:
         self,
         base_url: str = "http://ollama:11434",
         model: str = "deepseek-r1:14b",
-        timeout: int = 120
+        timeout: int = 120,
+        keep_alive: Union[str, int] = "30m"
     ):
         """
         Initialize Ollama client
@@ -54,10 +57,13 @@ class OllamaClient:
             base_url: Ollama API base URL
             model: Model name to use
             timeout: Request timeout in seconds
+            keep_alive: How long Ollama keeps the model loaded after each request
+                (sent with every request; Ollama's default is 5m)
         """
         self.base_url = base_url.rstrip('/')
         self.model = model
         self.timeout = timeout
+        self.keep_alive = keep_alive
         self.client = httpx.AsyncClient(timeout=timeout)
 
         logger.info(
@@ -78,6 +84,45 @@ class OllamaClient:
             logger.error(f"Ollama connection check failed: {e}")
             return False
 
+    async def warm_model(self) -> bool:
+        """
+        Load the model into memory without generating anything
+
+        Ollama loads a model on a generate request with an empty prompt and
+        returns as soon as it is resident.
+
+        Returns:
+            True if the model is loaded
+        """
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.model, "prompt": "", "stream": False, "keep_alive": self.keep_alive}
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {e}")
+            return False
+
+    async def keep_warm(self, interval_seconds: float = 300):
+        """
+        Background task loading the model now and re-warming it periodically
+
+        Keeps the model resident across Ollama's idle unload timeout, so user
+        requests never pay the model load time.
+
+        Args:
+            interval_seconds: Seconds between warm-up requests (well below keep_alive)
+        """
+        try:
+            while True:
+                if await self.warm_model():
+                    logger.debug(f"Model {self.model} is warm")
+                await asyncio.sleep(interval_seconds)
+        except asyncio.CancelledError:
+            pass
+
     async def list_models(self) -> List[Dict[str, Any]]:
         """
         List available models
@@ -157,6 +202,7 @@ class OllamaClient:
                     for msg in messages
                 ],
                 "stream": False,
+                "keep_alive": self.keep_alive,
                 "options": {
                     "temperature": temperature,
                 }
@@ -181,6 +227,8 @@ class OllamaClient:
             reasoning = None
             actual_content = content
 
+            truncated = data.get('done_reason') == 'length'
+
             if show_reasoning and '<think>' in content and '</think>' in content:
                 # DeepSeek-R1 wraps thinking in <think> tags
                 try:
@@ -190,6 +238,14 @@ class OllamaClient:
                     actual_content = content[think_end + 8:].strip()
                 except ValueError:
                     pass
+            elif '<think>' in content and '</think>' not in content:
+                # Generation stopped inside the reasoning block: no answer was produced
+                before, thought = content.split('<think>', 1)
+                if show_reasoning:
+                    reasoning = thought.strip() or None
+                actual_content = before.strip()
+                truncated = True
+                logger.warning("LLM response ended inside <think>, answer truncated")
 
             # Get metrics
             total_duration = data.get('total_duration')
@@ -202,7 +258,8 @@ class OllamaClient:
                 model=data.get('model'),
                 total_duration_ms=total_duration // 1_000_000 if total_duration else None,
                 prompt_tokens=prompt_eval_count,
-                completion_tokens=eval_count
+                completion_tokens=eval_count,
+                truncated=truncated
             )
 
         except Exception as e:
@@ -261,6 +318,7 @@ class OllamaClient:
                     for msg in messages
                 ],
                 "stream": True,
+                "keep_alive": self.keep_alive,
                 "options": {
                     "temperature": temperature,
                 }
@@ -288,6 +346,31 @@ class OllamaClient:
             logger.error(f"Streaming chat failed: {e}")
             raise
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ):
+        """
+        Stream completion for a prompt
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Response chunks
+        """
+        messages = [ChatMessage(role="user", content=prompt)]
+        async for chunk in self.chat_stream(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        ):
+            yield chunk
+
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
@@ -4,9 +4,53 @@ Bilingual (Thai + English) prompts for various tasks
 """
 
 import json
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+import orjson
+
+
+def _dump_context(data: Any) -> str:
+    """Pretty-print context data as JSON (orjson; the stdlib encoder is pure Python when indenting)"""
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(data, ensure_ascii=False, indent=2, default=str)
+
+
+@lru_cache(maxsize=512)
+def _render_shift_summary(
+    shift_name: str,
+    total_workers: int,
+    avg_productivity: float,
+    total_output: int,
+    issues: Optional[Tuple[str, ...]]
+) -> str:
+    """Render (and memoize) the shift summary prompt"""
+    shift_thai = {
+        'morning': 'กะเช้า',
+        'afternoon': 'กะบ่าย',
+        'night': 'กะดึก'
+    }.get(shift_name, shift_name)
+
+    prompt = f"""สรุปผลการทำงาน{shift_thai}
+
+สถิติโดยรวม:
+- จำนวนพนักงาน: {total_workers} คน
+- ประสิทธิภาพเฉลี่ย: {avg_productivity:.1f}/100
+- ผลผลิตรวม: {total_output} ชิ้น
+"""
+
+    if issues:
+        prompt += "\nปัญหาที่พบ:\n"
+        for issue in issues:
+            prompt += f"- {issue}\n"
+
+    prompt += "\nกรุณาสรุปผลการทำงานและให้คำแนะนำสำหรับการปรับปรุง"
+
+    return prompt
+
 
 class PromptTemplate:
     """
@@ -123,28 +167,13 @@ Format reports in clear, professional Thai or English based on user preference."
         Returns:
             Formatted prompt
         """
-        shift_thai = {
-            'morning': 'กะเช้า',
-            'afternoon': 'กะบ่าย',
-            'night': 'กะดึก'
-        }.get(shift_name, shift_name)
-
-        prompt = f"""สรุปผลการทำงาน{shift_thai}
-
-สถิติโดยรวม:
-- จำนวนพนักงาน: {total_workers} คน
-- ประสิทธิภาพเฉลี่ย: {avg_productivity:.1f}/100
-- ผลผลิตรวม: {total_output} ชิ้น
-"""
-
-        if issues:
-            prompt += "\nปัญหาที่พบ:\n"
-            for issue in issues:
-                prompt += f"- {issue}\n"
-
-        prompt += "\nกรุณาสรุปผลการทำงานและให้คำแนะนำสำหรับการปรับปรุง"
-
-        return prompt
+        return _render_shift_summary(
+            shift_name,
+            total_workers,
+            avg_productivity,
+            total_output,
+            tuple(issues) if issues else None
+        )
 
     @staticmethod
     def anomaly_detection(
@@ -288,7 +317,7 @@ Format reports in clear, professional Thai or English based on user preference."
         prompt = f"""คำถาม: {question}
 
 ข้อมูลที่เกี่ยวข้อง:
-{json.dumps(context_data, ensure_ascii=False, indent=2)}
+{_dump_context(context_data)}
 
 กรุณาตอบคำถามโดยใช้ข้อมูลที่ให้มา ตอบเป็นภาษาเดียวกับคำถาม"""
 
@@ -0,0 +1,216 @@
+"""
+Semantic Response Cache
+Reuses LLM answers for questions that are paraphrases of earlier ones
+"""
+
+import asyncio
+import logging
+import re
+import time
+import uuid
+from typing import Optional, Dict, Any
+
+import numpy as np
+from qdrant_client.models import Filter, FieldCondition, FilterSelector, Range
+
+from rag.qdrant_manager import QdrantManager
+
+logger = logging.getLogger(__name__)
+
+# Tokens containing digits (worker IDs, dates, thresholds) and time-scope words.
+# Questions differing only in these embed almost identically, so a cache hit
+# also requires them to match exactly.
+_DIGIT_TOKEN = re.compile(r"[^\W\d_]*\d[\w\-/:.]*")
+_SCOPE_WORDS = (
+    "today", "yesterday", "tomorrow", "week", "month", "last", "next",
+    "morning", "afternoon", "night",
+    "วันนี้", "เมื่อวาน", "พรุ่งนี้", "สัปดาห์", "เดือน", "ที่แล้ว", "เช้า", "บ่าย", "ดึก"
+)
+
+
+def _query_entities(question: str) -> str:
+    """
+    Exact-match key of the entities in a question
+
+    Args:
+        question: Natural language question
+
+    Returns:
+        Sorted, '|'-joined digit tokens and time-scope words (lowercased)
+    """
+    text = question.lower()
+    tokens = {m.group(0).rstrip('.:') for m in _DIGIT_TOKEN.finditer(text)}
+    tokens.update(word for word in _SCOPE_WORDS if word in text)
+    return "|".join(sorted(tokens))
+
+
+class SemanticCache:
+    """
+    Semantic cache for natural language query responses
+
+    Stores answered questions in a Qdrant collection keyed by the question
+    embedding. A new question whose cosine similarity to a cached one is at
+    least `threshold`, and whose worker IDs, dates and other entities
+    (_query_entities) are identical, gets the cached answer instead of a new
+    RAG + LLM run.
+    """
+
+    COLLECTION = "ai_query_cache"
+
+    def __init__(
+        self,
+        qdrant_manager: QdrantManager,
+        threshold: float = 0.92,
+        ttl_seconds: int = 3600
+    ):
+        """
+        Initialize semantic cache
+
+        Args:
+            qdrant_manager: Qdrant manager instance (shared with the knowledge base)
+            threshold: Minimum cosine similarity for a cache hit
+            ttl_seconds: Seconds before a cached answer expires
+        """
+        self.qdrant = qdrant_manager
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._collection_ready = False
+
+        self.hits = 0
+        self.misses = 0
+
+        logger.info(
+            f"SemanticCache initialized (threshold={threshold}, ttl={ttl_seconds}s)"
+        )
+
+    def _ensure_collection(self) -> bool:
+        """Create the cache collection on first use"""
+        if not self._collection_ready:
+            self._collection_ready = self.qdrant.create_collection(self.COLLECTION)
+        return self._collection_ready
+
+    def lookup(
+        self,
+        query_vector: np.ndarray,
+        question: str,
+        show_reasoning: bool,
+        max_context_items: int,
+        threshold: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer for a similar question
+
+        Args:
+            query_vector: Normalized question embedding
+            question: Question text (its entities must match the cached one)
+            show_reasoning: Reasoning flag of the request (must match the cached one)
+            max_context_items: Context size of the request (must match the cached one)
+            threshold: Override for the similarity threshold
+
+        Returns:
+            Cached payload (question, answer, reasoning, context_used, model) or None
+        """
+        if not self._ensure_collection():
+            return None
+
+        results = self.qdrant.search(
+            collection_name=self.COLLECTION,
+            query_vector=query_vector,
+            limit=1,
+            score_threshold=self.threshold if threshold is None else threshold,
+            filter_conditions={
+                'entities': _query_entities(question),
+                'show_reasoning': show_reasoning,
+                'max_context_items': max_context_items
+            }
+        )
+
+        if results and results[0]['payload'].get('expires_at', 0) > time.time():
+            self.hits += 1
+            return results[0]['payload']
+
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        query_vector: np.ndarray,
+        show_reasoning: bool,
+        max_context_items: int,
+        response: Dict[str, Any]
+    ) -> bool:
+        """
+        Store an answered question
+
+        Args:
+            query_vector: Normalized question embedding
+            show_reasoning: Reasoning flag of the request
+            max_context_items: Context size of the request
+            response: Response fields (question, answer, reasoning, context_used, model)
+
+        Returns:
+            True if successful
+        """
+        if not self._ensure_collection():
+            return False
+
+        now = time.time()
+        point = {
+            'id': str(uuid.uuid4()),
+            **response,
+            'entities': _query_entities(response['question']),
+            'show_reasoning': show_reasoning,
+            'max_context_items': max_context_items,
+            'cached_at': now,
+            'expires_at': now + self.ttl_seconds
+        }
+
+        return self.qdrant.upsert_points(
+            collection_name=self.COLLECTION,
+            points=[point],
+            embeddings=query_vector.reshape(1, -1)
+        )
+
+    def purge_expired(self) -> bool:
+        """
+        Delete expired entries
+
+        Returns:
+            True if successful
+        """
+        if not self._collection_ready:
+            return True
+
+        try:
+            self.qdrant.client.delete(
+                collection_name=self.COLLECTION,
+                points_selector=FilterSelector(
+                    filter=Filter(
+                        must=[FieldCondition(key='expires_at', range=Range(lt=time.time()))]
+                    )
+                )
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to purge semantic cache: {e}")
+            return False
+
+    async def purge_loop(self, interval_seconds: float = 600):
+        """Background task purging expired entries periodically"""
+        try:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                await asyncio.to_thread(self.purge_expired)
+        except asyncio.CancelledError:
+            pass
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            'threshold': self.threshold,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
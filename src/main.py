@@ -14,6 +14,7 @@ from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+import anyio.to_thread
 from loguru import logger
 
 # Import modules
@@ -37,6 +38,7 @@ from llm.ollama_client import OllamaClient
 from rag.embeddings import EmbeddingGenerator
 from rag.qdrant_manager import QdrantManager
 from rag.knowledge_base import KnowledgeBase
+from llm.semantic_cache import SemanticCache
 from insights.insight_generator import InsightGenerator
 from insights.anomaly_detector import AnomalyDetector
 from insights.recommendation_engine import RecommendationEngine
@@ -48,6 +50,7 @@ from analytics.predictive_analytics import PredictiveAnalytics
 from analytics.visualization_data import VisualizationData
 from analytics.benchmarking import Benchmarking
 from analytics.export_manager import ExportManager
+from analytics.forecast_pool import shutdown_forecast_pool
 
 # Import API routers
 from api.v1 import cameras, detection, zones, tracking, workers, ai_query, analytics, websocket
@@ -72,6 +75,7 @@ ollama_client = None
 embedding_generator = None
 qdrant_manager = None
 knowledge_base = None
+semantic_cache = None
 insight_generator = None
 anomaly_detector = None
 recommendation_engine = None
@@ -84,6 +88,10 @@ visualization_data = None
 benchmarking = None
 export_manager = None
 
+# Long-running asyncio tasks started at startup (asyncio keeps only weak
+# references to tasks, so they are held here and cancelled on shutdown)
+background_tasks = []
+
 # Application instance
 app = FastAPI(
     title="Assembly Time-Tracking System",
@@ -185,7 +193,7 @@ async def startup_event():
     global camera_manager, zone_manager, tracking_manager, detection_manager
     global db_manager, detection_writer, tracking_writer
     global worker_manager, face_recognizer, badge_ocr, time_tracker
-    global ollama_client, embedding_generator, qdrant_manager, knowledge_base
+    global ollama_client, embedding_generator, qdrant_manager, knowledge_base, semantic_cache
     global insight_generator, anomaly_detector, recommendation_engine, report_generator
     global realtime_analytics, predictive_analytics, visualization_data, benchmarking, export_manager
 
@@ -197,6 +205,9 @@ async def startup_event():
     logger.info("Status: Development Mode")
     logger.info("-" * 60)
 
+    # Threadpool for sync (`def`) endpoints such as the forecast handlers
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+
     # Initialize database
     logger.info("💾 Initializing PostgreSQL connection...")
     db_manager = DatabaseManager()
@@ -287,6 +298,14 @@ async def startup_event():
         embedding_generator=embedding_generator
     )
 
+    logger.info("🧠 Initializing Semantic Cache...")
+    semantic_cache = SemanticCache(
+        qdrant_manager=qdrant_manager,
+        threshold=0.92,
+        ttl_seconds=3600
+    )
+    background_tasks.append(asyncio.create_task(semantic_cache.purge_loop()))
+
     logger.info("💡 Initializing Insight Generator...")
     insight_generator = InsightGenerator(
         ollama_client=ollama_client,
@@ -362,7 +381,9 @@ async def startup_event():
 
     # Phase 4B: Inject AI services into AI Query API
     ai_query.set_ollama_client(ollama_client)
+    background_tasks.append(asyncio.create_task(ollama_client.keep_warm(interval_seconds=300)))
     ai_query.set_knowledge_base(knowledge_base)
+    ai_query.set_semantic_cache(semantic_cache)
 
     # Phase 4C: Inject Advanced Analytics services
     analytics.set_realtime_analytics(realtime_analytics)
@@ -425,6 +446,12 @@ async def shutdown_event():
     logger.info("Assembly Time-Tracking System - Shutting Down")
     logger.info("=" * 60)
 
+    # Stop background tasks
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+
     # Stop detection
     if detection_manager:
         logger.info("Stopping detection...")
@@ -445,6 +472,9 @@ async def shutdown_event():
         logger.info("Closing database connection...")
         await db_manager.close()
 
+    # Stop forecast worker processes (only started if a large forecast ran)
+    shutdown_forecast_pool()
+
     logger.info("✅ Cleanup complete")
 
 
@@ -7,6 +7,7 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
+import numpy as np
 
 from .embeddings import EmbeddingGenerator
 from .qdrant_manager import QdrantManager
@@ -170,6 +171,7 @@ Overall Productivity: {indices.index_11_overall_productivity:.1f}/100
                 'work_efficiency': indices.index_5_work_efficiency,
                 'output_per_hour': indices.index_9_output_per_hour,
                 'quality_score': indices.index_10_quality_score,
+                'tasks_completed': indices.index_8_tasks_completed,
                 'indices': indices.dict(),
                 'text': text,
                 'indexed_at': datetime.now().isoformat()
@@ -365,10 +367,50 @@ Status: {'Active' if session.is_active else 'Completed'}
 
         return results
 
+    def search_productivity_batch(
+        self,
+        queries: List[str],
+        worker_ids: List[Optional[str]],
+        limit: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search productivity data for several queries at once
+
+        Embeds all queries in one model call and sends a single batch
+        search to Qdrant instead of one round-trip per query.
+
+        Args:
+            queries: Search queries
+            worker_ids: Worker ID filter per query (None for no filter)
+            limit: Maximum results per query
+
+        Returns:
+            List of matching productivity records per query, in query order
+        """
+        if not queries:
+            return []
+
+        query_vectors = self.embedder.encode(queries, normalize=True)
+
+        filter_conditions = []
+        for worker_id in worker_ids:
+            conditions = {'type': 'productivity_indices'}
+            if worker_id:
+                conditions['worker_id'] = worker_id
+            filter_conditions.append(conditions)
+
+        return self.qdrant.search_batch(
+            collection_name=self.COLLECTION_PRODUCTIVITY,
+            query_vectors=query_vectors,
+            limit=limit,
+            filter_conditions=filter_conditions
+        )
+
     def get_context_for_query(
         self,
         query: str,
-        max_results: int = 5
+        max_results: int = 5,
+        query_vector: Optional[np.ndarray] = None
     ) -> Dict[str, Any]:
         """
         Get relevant context for a natural language query
@@ -376,11 +418,13 @@ Status: {'Active' if session.is_active else 'Completed'}
         Args:
             query: User's question
             max_results: Maximum results per collection
+            query_vector: Precomputed query embedding (skips re-encoding)
 
         Returns:
             Dict with context from all collections
         """
-        query_vector = self.embedder.encode_query(query)
+        if query_vector is None:
+            query_vector = self.embedder.encode_query(query)
 
         context = {
             'query': query,
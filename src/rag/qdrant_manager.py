@@ -174,36 +174,16 @@ class QdrantManager:
             List of search results with scores
         """
         try:
-            # Build filter if conditions provided
-            query_filter = None
-            if filter_conditions:
-                conditions = []
-                for key, value in filter_conditions.items():
-                    conditions.append(
-                        FieldCondition(
-                            key=key,
-                            match=MatchValue(value=value)
-                        )
-                    )
-                query_filter = Filter(must=conditions)
-
             # Search
             results = self.client.search(
                 collection_name=collection_name,
                 query_vector=query_vector.tolist(),
                 limit=limit,
                 score_threshold=score_threshold,
-                query_filter=query_filter
+                query_filter=self._build_filter(filter_conditions)
             )
 
-            # Format results
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    'id': result.id,
-                    'score': result.score,
-                    'payload': result.payload
-                })
+            formatted_results = self._format_results(results)
 
             logger.debug(
                 f"Found {len(formatted_results)} results in '{collection_name}'"
@@ -215,6 +195,71 @@ class QdrantManager:
             logger.error(f"Search failed in '{collection_name}': {e}")
             return []
 
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: np.ndarray,
+        limit: int = 5,
+        filter_conditions: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several similarity searches in a single request
+
+        Args:
+            collection_name: Collection name
+            query_vectors: Query embeddings (2D, one row per search)
+            limit: Maximum number of results per search
+            filter_conditions: Metadata filter per search (same order as query_vectors)
+
+        Returns:
+            List of search results per query, in query order
+        """
+        if filter_conditions is None:
+            filter_conditions = [None] * len(query_vectors)
+
+        try:
+            requests = [
+                SearchRequest(
+                    vector=vector.tolist(),
+                    filter=self._build_filter(conditions),
+                    limit=limit,
+                    with_payload=True
+                )
+                for vector, conditions in zip(query_vectors, filter_conditions)
+            ]
+
+            batch_results = self.client.search_batch(
+                collection_name=collection_name,
+                requests=requests
+            )
+
+            return [self._format_results(results) for results in batch_results]
+
+        except Exception as e:
+            logger.error(f"Batch search failed in '{collection_name}': {e}")
+            return [[] for _ in range(len(query_vectors))]
+
+    def _build_filter(self, filter_conditions: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build an exact-match filter from metadata conditions"""
+        if not filter_conditions:
+            return None
+
+        return Filter(must=[
+            FieldCondition(key=key, match=MatchValue(value=value))
+            for key, value in filter_conditions.items()
+        ])
+
+    def _format_results(self, results) -> List[Dict[str, Any]]:
+        """Convert scored points to plain dicts"""
+        return [
+            {
+                'id': result.id,
+                'score': result.score,
+                'payload': result.payload
+            }
+            for result in results
+        ]
+
     def delete_points(
         self,
         collection_name: str,